@@ -1,9 +1,11 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Optional, Callable, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Callable, Tuple, TYPE_CHECKING
 import subprocess
 import os
+import threading
 import random
 import socket
 import shutil
@@ -37,6 +39,23 @@ YANDEX_CLOUD_CLI = "yc"
 DOCKER_COMPOSE_CMD = "docker compose" # Changed to list for subprocess
 
 
+def synchronized_log_func(log_func: Callable[[str], None]) -> Callable[[str], None]:
+    """
+    Wrap a log function so that setup steps running on several threads
+    never call it at the same time.
+
+    :param log_func: The log function, usually ctx.log_func.
+    :return: A log function that calls log_func under a lock.
+    """
+    lock = threading.Lock()
+
+    def locked_log_func(message: str) -> None:
+        with lock:
+            log_func(message)
+
+    return locked_log_func
+
+
 def _run_command(command: list[str], cwd: Path, log_func: Callable, check: bool = True) -> subprocess.CompletedProcess:
     """
     Runs a command in a subprocess, logging output.
@@ -489,15 +508,93 @@ def setup_bucket(ctx: 'ProjectSetupContext', bucket_name: str, public_read: bool
         bool: True if bucket exists or was created successfully (including optional configuration),
               False if creation failed.
     """
+    result, created = _ensure_bucket(ctx, bucket_name, public_read)
+    if created and public_read:
+        ctx.public_url = f"https://{bucket_name}.website.yandexcloud.net/"
+    return result
+
+
+def setup_buckets(ctx: 'ProjectSetupContext', buckets: Dict[str, bool]) -> Dict[str, bool]:
+    """
+    Creates several buckets concurrently, each as setup_bucket() would.
+
+    Bucket checks and creation are independent network calls, so they run in
+    parallel. The workers neither touch ctx nor call ctx.log_func; their
+    messages are replayed and ctx.public_url is updated on the calling
+    thread, in the order the buckets were given.
+
+    Args:
+        ctx: The project setup context.
+        buckets: Mapping of bucket name to its public_read flag.
+
+    Returns:
+        Dict[str, bool]: setup_bucket() result for each bucket name.
+
+    Raises:
+        Exception: If setting up any bucket raised; raised after all buckets
+            are done, naming every bucket that failed.
+    """
+    if not buckets:
+        return {}
+
+    messages = {bucket_name: [] for bucket_name in buckets}
+    with ThreadPoolExecutor(max_workers=len(buckets)) as executor:
+        futures = {
+            bucket_name: executor.submit(
+                _ensure_bucket, ctx, bucket_name, public_read, messages[bucket_name].append
+            )
+            for bucket_name, public_read in buckets.items()
+        }
+
+    results = {}
+    errors = {}
+    for bucket_name, public_read in buckets.items():
+        for message in messages[bucket_name]:
+            ctx.log_func(message)
+        try:
+            result, created = futures[bucket_name].result()
+        except Exception as e:
+            logger.error(f"Error setting up bucket {bucket_name}: {e}")
+            ctx.log_func(f"❌ Error setting up bucket '{bucket_name}': {e}")
+            errors[bucket_name] = e
+            continue
+        if created and public_read:
+            ctx.public_url = f"https://{bucket_name}.website.yandexcloud.net/"
+        results[bucket_name] = result
+
+    if errors:
+        failed = ", ".join(f"{bucket_name} ({e})" for bucket_name, e in errors.items())
+        raise Exception(f"Bucket setup failed for: {failed}") from next(iter(errors.values()))
+    return results
+
+
+def _ensure_bucket(
+    ctx: 'ProjectSetupContext',
+    bucket_name: str,
+    public_read: bool,
+    log_func: Optional[Callable[[str], None]] = None
+) -> Tuple[bool, bool]:
+    """
+    Creates a bucket unless it already exists; does not modify ctx.
+
+    Args:
+        ctx: The project setup context.
+        bucket_name: The name of the bucket to create.
+        public_read: If True, bucket will be public for read.
+        log_func: Where progress messages go (default: ctx.log_func).
+
+    Returns:
+        Tuple[bool, bool]: (bucket exists or was created, bucket was created by this call)
+    """
     from infra.providers.cloud.yandex.storage.bucket import create_bucket, check_bucket_exists
-    log_func = ctx.log_func
+    log_func = log_func or ctx.log_func
     log_func(f"🔄 Checking if bucket '{bucket_name}' already exists...")
     if check_bucket_exists(bucket_name):
         log_func(f"ℹ️ Bucket '{bucket_name}' already exists. Skipping creation/configuration.")
         logger.info(f"Bucket {bucket_name} already exists. Skipping creation/configuration.")
         # Optionally, we could add logic here to *ensure* website config is set even if bucket exists
         # For now, if it exists, we assume it's configured correctly.
-        return True
+        return True, False
 
     log_func(f"   Bucket '{bucket_name}' does not exist. Proceeding with creation and configuration...")
     logger.info(f"Bucket {bucket_name} does not exist. Creating and configuring new bucket.")
@@ -509,17 +606,16 @@ def setup_bucket(ctx: 'ProjectSetupContext', bucket_name: str, public_read: bool
         # Log success based on the public_read flag
         if public_read:
             log_func(f"✅ Bucket '{bucket_name}' created and configured for website hosting successfully.")
-            ctx.public_url = f"https://{bucket_name}.website.yandexcloud.net/"
         else:
             log_func(f"✅ Bucket '{bucket_name}' created successfully (website hosting skipped).")
-    else:
-        # Check if it might exist despite creation failure (e.g., race condition or API error)
-        if check_bucket_exists(bucket_name):
-            log_func(f"ℹ️ Bucket '{bucket_name}' now exists (detected after creation attempt). Assuming success.")
-            # Here we might still want to attempt configuration if public_read is True,
-            # but let's keep it simple for now.
-            return True
-        else:
-            log_func(f"❌ Failed to create bucket '{bucket_name}'. Check logs for details.")
-            return False
-    return result
\ No newline at end of file
+        return True, True
+
+    # Check if it might exist despite creation failure (e.g., race condition or API error)
+    if check_bucket_exists(bucket_name):
+        log_func(f"ℹ️ Bucket '{bucket_name}' now exists (detected after creation attempt). Assuming success.")
+        # Here we might still want to attempt configuration if public_read is True,
+        # but let's keep it simple for now.
+        return True, False
+
+    log_func(f"❌ Failed to create bucket '{bucket_name}'. Check logs for details.")
+    return False, False
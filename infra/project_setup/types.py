@@ -1,6 +1,7 @@
+import copy
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Callable, Dict, Any
+from typing import FrozenSet, List, Optional, Callable, Dict, Any
 
 @dataclass
 class ProjectSetupContext:
@@ -22,7 +23,21 @@ class ProjectSetupContext:
     # Dictionary to store environment variables for the project's .env file
     project_env: Dict[str, str] = field(default_factory=dict, init=False)
     # Stores the names of secrets that *already exist* in the GitHub repo
-    existing_github_secrets: Optional[List[str]] = None
+    existing_github_secrets: Optional[FrozenSet[str]] = None
     public_url: Optional[str] = None
     # Store general database connection details
-    # db_info: Optional[Dict[str, any]] = field(default=None, init=False)
\ No newline at end of file
+    # db_info: Optional[Dict[str, any]] = field(default=None, init=False)
+
+    def with_project_dir(self, project_dir: Path) -> 'ProjectSetupContext':
+        """
+        Return a copy of the context for a sub-directory of the project.
+
+        A shallow copy with fresh dictionaries: writes to the copy's
+        secrets, env or step data do not reach this context.
+        """
+        sub_ctx = copy.copy(self)
+        sub_ctx.project_dir = project_dir
+        sub_ctx.step_data = dict(self.step_data)
+        sub_ctx.github_secrets = dict(self.github_secrets)
+        sub_ctx.project_env = dict(self.project_env)
+        return sub_ctx
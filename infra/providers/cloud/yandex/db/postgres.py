@@ -5,17 +5,56 @@ Functions for managing PostgreSQL databases in Yandex Cloud.
 import logging
 import subprocess
 import os
-import random
+import secrets
 import string
-import json
 import tempfile
 import atexit
-from typing import Dict, Any, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+# orjson parses the multi-KB `yc --format json` listings considerably faster;
+# fall back to the standard library when it is not installed.
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# ijson lets us stop reading `yc` output as soon as the wanted item is found.
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
 
 from infra.config import Config
 
 logger = logging.getLogger(__name__)
 
+# How long (in seconds) parsed `user list` / `database list` results are reused.
+# Keeps batch provisioning of many databases on one cluster from re-listing
+# the cluster for every database.
+LIST_CACHE_TTL = 15
+
+# Cache of parsed listings: (kind, cluster_id) -> (fetched_at, {name: object})
+_list_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+
+# Authenticated environment for yc commands, built once per process and per
+# set of credentials (see get_yc_env)
+_yc_env: Optional[Dict[str, str]] = None
+_yc_env_key: Optional[Tuple[str, str, str]] = None
+_yc_env_lock = threading.Lock()
+
+
+# Alphabet for generated passwords and the lookup tables used to map random
+# bytes onto it. Bytes >= _PASSWORD_BYTE_LIMIT are discarded so that every
+# character is equally likely.
+_PASSWORD_ALPHABET = (string.ascii_lowercase + string.ascii_uppercase + string.digits).encode("ascii")
+_PASSWORD_BYTE_LIMIT = 256 - 256 % len(_PASSWORD_ALPHABET)
+_PASSWORD_BYTE_TABLE = bytes(_PASSWORD_ALPHABET[i % len(_PASSWORD_ALPHABET)] for i in range(256))
+_PASSWORD_BIASED_BYTES = bytes(range(_PASSWORD_BYTE_LIMIT, 256))
+_system_random = secrets.SystemRandom()
+
 
 class YandexCloudDBError(Exception):
     """Exception raised for errors in Yandex Cloud database operations."""
@@ -33,29 +72,90 @@ def generate_secure_password(length: int = 16) -> str:
     Returns:
         A secure random alphanumeric password string
     """
-    # Define character sets - using only alphanumeric characters
-    lowercase = string.ascii_lowercase
-    uppercase = string.ascii_uppercase
-    digits = string.digits
-
     # Ensure at least one character from each set
     password = [
-        random.choice(lowercase),
-        random.choice(uppercase),
-        random.choice(digits)
+        secrets.choice(string.ascii_lowercase),
+        secrets.choice(string.ascii_uppercase),
+        secrets.choice(string.digits)
     ]
 
-    # Fill the rest of the password
+    # Fill the rest of the password from os.urandom in bulk: bytes.translate()
+    # drops the bytes that would bias the modulo mapping and maps the rest
+    # onto the alphabet in C
     remaining_length = length - len(password)
-    all_chars = lowercase + uppercase + digits
-    password.extend(random.choice(all_chars) for _ in range(remaining_length))
+    random_chars = b""
+    while len(random_chars) < remaining_length:
+        random_chars += os.urandom(remaining_length * 2).translate(
+            _PASSWORD_BYTE_TABLE, _PASSWORD_BIASED_BYTES
+        )
+    password.extend(random_chars[:remaining_length].decode("ascii"))
 
     # Shuffle the password characters
-    random.shuffle(password)
+    _system_random.shuffle(password)
 
     return ''.join(password)
 
 
+def _index_by_name(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Index a `yc` listing (users, databases, hosts) by the "name" field.
+
+    Args:
+        items: List of objects as returned by `yc ... list --format json`
+
+    Returns:
+        Dictionary mapping each object's name to the object itself
+    """
+    return {item["name"]: item for item in items if "name" in item}
+
+
+def _list_cluster_objects(kind: str, cluster_id: str, env: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """
+    List users or databases of a PostgreSQL cluster, indexed by name.
+
+    Results are cached for LIST_CACHE_TTL seconds per cluster and kind;
+    callers that modify the cluster must call _invalidate_list_cache().
+
+    Args:
+        kind: Either "user" or "database"
+        cluster_id: ID of the PostgreSQL cluster
+        env: Environment variables for the yc command
+
+    Returns:
+        Dictionary mapping object names to objects
+
+    Raises:
+        YandexCloudDBError: If the yc command fails
+    """
+    key = (kind, cluster_id)
+    cached = _list_cache.get(key)
+    if cached and time.monotonic() - cached[0] < LIST_CACHE_TTL:
+        logger.debug(f"Using cached {kind} list for cluster {cluster_id}")
+        return cached[1]
+
+    list_cmd = [
+        "yc", "managed-postgresql", kind, "list",
+        "--cluster-id", cluster_id,
+        "--format", "json"
+    ]
+    result = _run_yc_command(list_cmd, env)
+    objects_by_name = _index_by_name(_json.loads(result.stdout))
+
+    _list_cache[key] = (time.monotonic(), objects_by_name)
+    return objects_by_name
+
+
+def _invalidate_list_cache(kind: str, cluster_id: str) -> None:
+    """
+    Drop the cached listing of the given kind for a cluster.
+
+    Args:
+        kind: Either "user" or "database"
+        cluster_id: ID of the PostgreSQL cluster
+    """
+    _list_cache.pop((kind, cluster_id), None)
+
+
 def get_yc_configuration() -> Dict[str, str]:
     """
     Get Yandex Cloud configuration from environment.
@@ -94,6 +194,64 @@ def get_yc_configuration() -> Dict[str, str]:
     return result
 
 
+def _remove_file(path: str) -> None:
+    """Remove a file if it still exists, logging instead of raising on failure."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove temporary file {path}: {str(e)}")
+
+
+def get_yc_env(yc_config: Dict[str, str]) -> Dict[str, str]:
+    """
+    Get the environment for running yc commands as the configured service account.
+
+    The service account key is written to a temporary file only once per process
+    (and per set of credentials) and removed at interpreter exit, so consecutive
+    operations reuse the same authenticated yc environment instead of
+    re-creating it for every call.
+
+    Args:
+        yc_config: Yandex Cloud configuration as returned by get_yc_configuration()
+
+    Returns:
+        The environment with YC_SERVICE_ACCOUNT_KEY_FILE, YC_CLOUD_ID and
+        YC_FOLDER_ID set. The dict is shared between calls and must not be
+        modified; copy it first if extra variables are needed.
+    """
+    global _yc_env, _yc_env_key
+
+    key = (
+        yc_config["YC_SA_JSON_CREDENTIALS"],
+        yc_config["YC_CLOUD_ID"],
+        yc_config["YC_FOLDER_ID"],
+    )
+    if _yc_env is None or _yc_env_key != key:
+        with _yc_env_lock:
+            if _yc_env is None or _yc_env_key != key:
+                if _yc_env is not None:
+                    _remove_file(_yc_env["YC_SERVICE_ACCOUNT_KEY_FILE"])
+
+                # Create temporary file to store the JSON credentials
+                temp_file = tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False)
+                with temp_file:
+                    temp_file.write(yc_config["YC_SA_JSON_CREDENTIALS"])
+                atexit.register(_remove_file, temp_file.name)
+                logger.debug(f"Using service account JSON credentials from temporary file: {temp_file.name}")
+
+                env = os.environ.copy()
+                env["YC_SERVICE_ACCOUNT_KEY_FILE"] = temp_file.name
+                env["YC_CLOUD_ID"] = yc_config["YC_CLOUD_ID"]
+                env["YC_FOLDER_ID"] = yc_config["YC_FOLDER_ID"]
+
+                _yc_env = env
+                _yc_env_key = key
+
+    return _yc_env
+
+
 def _create_database_and_user(db_name: str) -> Tuple[str, str, str]:
     """
     Create a database and user in Yandex Cloud PostgreSQL cluster using yc CLI.
@@ -121,36 +279,16 @@ def _create_database_and_user(db_name: str) -> Tuple[str, str, str]:
     password = generate_secure_password()
 
     # Setup environment for yc commands
-    env = os.environ.copy()
-    temp_file = None
+    env = get_yc_env(yc_config)
 
     try:
-        # Create temporary file to store the JSON credentials
-        temp_file = tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False)
-        temp_file.write(yc_config["YC_SA_JSON_CREDENTIALS"])
-        temp_file.flush()
-        temp_file.close()
-
-        # Register cleanup to ensure the temporary file is removed
-        atexit.register(lambda: os.unlink(temp_file.name) if os.path.exists(temp_file.name) else None)
-
-        # Set environment variables for yc command
-        env["YC_SERVICE_ACCOUNT_KEY_FILE"] = temp_file.name
-        env["YC_CLOUD_ID"] = yc_config["YC_CLOUD_ID"]
-        env["YC_FOLDER_ID"] = yc_config["YC_FOLDER_ID"]
-
-        # Check if user exists
-        logger.debug(f"Checking if user {db_name} exists")
-        list_users_cmd = [
-            "yc", "managed-postgresql", "user", "list",
-            "--cluster-id", cluster_id,
-            "--format", "json"
-        ]
-
-        result = _run_yc_command(list_users_cmd, env)
-        users = json.loads(result.stdout)
-
-        user_exists = any(user["name"] == db_name for user in users)
+        # Each yc call pays the CLI startup cost, so list users and databases concurrently
+        logger.debug(f"Checking if user and database {db_name} exist")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            users_future = executor.submit(_list_cluster_objects, "user", cluster_id, env)
+            databases_future = executor.submit(_list_cluster_objects, "database", cluster_id, env)
+            user_exists = db_name in users_future.result()
+            db_exists = db_name in databases_future.result()
 
         # Create or update user
         if user_exists:
@@ -171,19 +309,7 @@ def _create_database_and_user(db_name: str) -> Tuple[str, str, str]:
                 "--password", password
             ]
             _run_yc_command(create_user_cmd, env)
-
-        # Check if database exists
-        logger.debug(f"Checking if database {db_name} exists")
-        list_dbs_cmd = [
-            "yc", "managed-postgresql", "database", "list",
-            "--cluster-id", cluster_id,
-            "--format", "json"
-        ]
-
-        result = _run_yc_command(list_dbs_cmd, env)
-        databases = json.loads(result.stdout)
-
-        db_exists = any(db["name"] == db_name for db in databases)
+            _invalidate_list_cache("user", cluster_id)
 
         # Create database if it doesn't exist
         if not db_exists:
@@ -195,6 +321,7 @@ def _create_database_and_user(db_name: str) -> Tuple[str, str, str]:
                 "--owner", db_name
             ]
             _run_yc_command(create_db_cmd, env)
+            _invalidate_list_cache("database", cluster_id)
         else:
             logger.info(f"Database {db_name} already exists")
 
@@ -210,13 +337,6 @@ def _create_database_and_user(db_name: str) -> Tuple[str, str, str]:
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}")
         raise YandexCloudDBError(f"Unexpected error: {str(e)}")
-    finally:
-        # Ensure the temporary file is removed
-        if temp_file and os.path.exists(temp_file.name):
-            try:
-                os.unlink(temp_file.name)
-            except Exception as e:
-                logger.warning(f"Failed to remove temporary file {temp_file.name}: {str(e)}")
 
 
 def create_database(db_name: str, db_type: str = "postgres") -> Dict[str, Any]:
@@ -275,36 +395,12 @@ def delete_database(db_name: str, db_type: str = "postgres") -> bool:
     _, cluster_id = _get_cluster_host_and_id(yc_config)
 
     # Setup environment for yc commands
-    env = os.environ.copy()
-    temp_file = None
+    env = get_yc_env(yc_config)
 
     try:
-        # Create temporary file to store the JSON credentials
-        temp_file = tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False)
-        temp_file.write(yc_config["YC_SA_JSON_CREDENTIALS"])
-        temp_file.flush()
-        temp_file.close()
-
-        # Register cleanup to ensure the temporary file is removed
-        atexit.register(lambda: os.unlink(temp_file.name) if os.path.exists(temp_file.name) else None)
-
-        # Set environment variables for yc command
-        env["YC_SERVICE_ACCOUNT_KEY_FILE"] = temp_file.name
-        env["YC_CLOUD_ID"] = yc_config["YC_CLOUD_ID"]
-        env["YC_FOLDER_ID"] = yc_config["YC_FOLDER_ID"]
-
         # Check if database exists
         logger.debug(f"Checking if database {db_name} exists")
-        list_dbs_cmd = [
-            "yc", "managed-postgresql", "database", "list",
-            "--cluster-id", cluster_id,
-            "--format", "json"
-        ]
-
-        dbs_output = subprocess.check_output(list_dbs_cmd, env=env, stderr=subprocess.PIPE)
-        databases = json.loads(dbs_output)
-
-        db_exists = any(db["name"] == db_name for db in databases)
+        db_exists = db_name in _list_cluster_objects("database", cluster_id, env)
 
         if not db_exists:
             logger.info(f"Database {db_name} does not exist, nothing to delete")
@@ -318,19 +414,11 @@ def delete_database(db_name: str, db_type: str = "postgres") -> bool:
             "--cluster-id", cluster_id
         ]
         subprocess.check_call(delete_db_cmd, env=env, stderr=subprocess.PIPE)
+        _invalidate_list_cache("database", cluster_id)
 
         # Check if user exists
         logger.debug(f"Checking if user {db_name} exists")
-        list_users_cmd = [
-            "yc", "managed-postgresql", "user", "list",
-            "--cluster-id", cluster_id,
-            "--format", "json"
-        ]
-
-        users_output = subprocess.check_output(list_users_cmd, env=env, stderr=subprocess.PIPE)
-        users = json.loads(users_output)
-
-        user_exists = any(user["name"] == db_name for user in users)
+        user_exists = db_name in _list_cluster_objects("user", cluster_id, env)
 
         if user_exists:
             # Delete user
@@ -341,6 +429,7 @@ def delete_database(db_name: str, db_type: str = "postgres") -> bool:
                 "--cluster-id", cluster_id
             ]
             subprocess.check_call(delete_user_cmd, env=env, stderr=subprocess.PIPE)
+            _invalidate_list_cache("user", cluster_id)
 
         logger.info(f"Successfully deleted database and user {db_name}")
         return True
@@ -354,13 +443,6 @@ def delete_database(db_name: str, db_type: str = "postgres") -> bool:
     except Exception as e:
         logger.error(f"Unexpected error during database deletion: {str(e)}")
         return False
-    finally:
-        # Ensure the temporary file is removed
-        if temp_file and os.path.exists(temp_file.name):
-            try:
-                os.unlink(temp_file.name)
-            except Exception as e:
-                logger.warning(f"Failed to remove temporary file {temp_file.name}: {str(e)}")
 
 
 def _get_cluster_host_and_id(yc_config: Dict[str, str]) -> Tuple[str, str]:
@@ -380,68 +462,41 @@ def _get_cluster_host_and_id(yc_config: Dict[str, str]) -> Tuple[str, str]:
         logger.debug("Getting PostgreSQL cluster information")
         cluster_id = yc_config["YC_POSTGRES_CLUSTER_ID"]
 
-        env = os.environ.copy()
-        temp_file = None
-
-        try:
-            # Create temporary file to store the JSON credentials
-            temp_file = tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False)
-            temp_file.write(yc_config["YC_SA_JSON_CREDENTIALS"])
-            temp_file.flush()
-            temp_file.close()
-
-            # Register cleanup to ensure the temporary file is removed
-            atexit.register(lambda: os.unlink(temp_file.name) if os.path.exists(temp_file.name) else None)
-
-            # Set the path to our temporary JSON file
-            logger.debug(f"Using service account JSON credentials from temporary file: {temp_file.name}")
-            env["YC_SERVICE_ACCOUNT_KEY_FILE"] = temp_file.name
-
-            env["YC_CLOUD_ID"] = yc_config["YC_CLOUD_ID"]
-            env["YC_FOLDER_ID"] = yc_config["YC_FOLDER_ID"]
-
-            # Get hosts list to retrieve the master host name
-            hosts_cmd = [
-                "yc", "managed-postgresql", "hosts", "list",
-                "--cluster-id", cluster_id,
-                "--format", "json"
-            ]
+        env = get_yc_env(yc_config)
 
-            logger.debug(f"Executing command: {' '.join(hosts_cmd)}")
-            hosts_output = subprocess.check_output(hosts_cmd, env=env, stderr=subprocess.PIPE)
-
-            hosts_data = json.loads(hosts_output)
-
-            # Extract host name from the hosts list (prefer MASTER)
-            host = None
-            for host_info in hosts_data:
-                if "role" in host_info and host_info["role"] == "MASTER":
-                    host = host_info["name"]
-                    logger.info(f"Found MASTER host: {host}")
-                    break
-
-            # If no master found or no role field, try the first host if available
-            if not host and hosts_data:
-                host = hosts_data[0]["name"]
-                logger.info(f"Using first host from list: {host}")
+        # Get hosts list to retrieve the master host name
+        hosts_cmd = [
+            "yc", "managed-postgresql", "hosts", "list",
+            "--cluster-id", cluster_id,
+            "--format", "json"
+        ]
 
-            # Fallback to internal FQDN if no host could be extracted
-            if not host:
-                host = f"{cluster_id}.postgresql.yandex.internal"
-                logger.warning(f"Could not extract host from hosts list, using fallback internal FQDN: {host}")
-            else:
-                # Ensure the extracted host is used (redundant log removed for clarity)
-                pass
+        # Extract host name from the hosts list (prefer MASTER),
+        # stopping as soon as the MASTER host has been read
+        host = None
+        first_host = None
+        for host_info in _iter_yc_json_items(hosts_cmd, env):
+            if first_host is None:
+                first_host = host_info["name"]
+            if "role" in host_info and host_info["role"] == "MASTER":
+                host = host_info["name"]
+                logger.info(f"Found MASTER host: {host}")
+                break
+
+        # If no master found or no role field, try the first host if available
+        if not host and first_host:
+            host = first_host
+            logger.info(f"Using first host from list: {host}")
+
+        # Fallback to internal FQDN if no host could be extracted
+        if not host:
+            host = f"{cluster_id}.postgresql.yandex.internal"
+            logger.warning(f"Could not extract host from hosts list, using fallback internal FQDN: {host}")
+        else:
+            # Ensure the extracted host is used (redundant log removed for clarity)
+            pass
 
-            return host, cluster_id
-
-        finally:
-            # Ensure the temporary file is removed
-            if temp_file and os.path.exists(temp_file.name):
-                try:
-                    os.unlink(temp_file.name)
-                except Exception as e:
-                    logger.warning(f"Failed to remove temporary file {temp_file.name}: {str(e)}")
+        return host, cluster_id
 
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to get PostgreSQL cluster info: {str(e)}")
@@ -479,33 +534,11 @@ def check_database_exists(db_name: str) -> bool:
         logger.error(f"Failed to get YC configuration or cluster info for existence check: {e}")
         raise # Propagate config errors
 
-    # Setup environment for yc commands using temporary file for credentials
-    env = os.environ.copy()
-    temp_file = None
+    # Setup environment for yc commands
+    env = get_yc_env(yc_config)
     try:
-        # Create temporary file for credentials
-        temp_file = tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False)
-        temp_file.write(yc_config["YC_SA_JSON_CREDENTIALS"])
-        temp_file.flush()
-        temp_file.close()
-        atexit.register(lambda: os.unlink(temp_file.name) if os.path.exists(temp_file.name) else None)
-
-        env["YC_SERVICE_ACCOUNT_KEY_FILE"] = temp_file.name
-        env["YC_CLOUD_ID"] = yc_config["YC_CLOUD_ID"]
-        env["YC_FOLDER_ID"] = yc_config["YC_FOLDER_ID"]
-
-        # Execute yc command to list databases
-        list_dbs_cmd = [
-            "yc", "managed-postgresql", "database", "list",
-            "--cluster-id", cluster_id,
-            "--format", "json"
-        ]
-        logger.debug(f"Executing command: {' '.join(list_dbs_cmd)}")
-        dbs_output = subprocess.check_output(list_dbs_cmd, env=env, stderr=subprocess.PIPE)
-        databases = json.loads(dbs_output)
-
-        # Check if the database name is in the list
-        db_exists = any(db.get("name") == db_name for db in databases)
+        # Check if the database name is in the (possibly cached) list
+        db_exists = db_name in _list_cluster_objects("database", cluster_id, env)
         logger.debug(f"Database '{db_name}' exists: {db_exists}")
         return db_exists
 
@@ -516,7 +549,9 @@ def check_database_exists(db_name: str) -> bool:
         logger.error(error_msg)
         # Raise for clarity, indicating the check could not be completed.
         raise YandexCloudDBError(error_msg)
-    except json.JSONDecodeError as e:
+    except YandexCloudDBError:
+        raise
+    except _json.JSONDecodeError as e:
         error_msg = f"Failed to parse database list JSON for cluster {cluster_id}: {e}"
         logger.error(error_msg)
         raise YandexCloudDBError(error_msg)
@@ -524,13 +559,55 @@ def check_database_exists(db_name: str) -> bool:
         error_msg = f"Unexpected error checking database existence: {str(e)}"
         logger.error(error_msg)
         raise YandexCloudDBError(error_msg)
-    finally:
-        # Ensure the temporary file is removed
-        if temp_file and os.path.exists(temp_file.name):
+
+
+def _iter_yc_json_items(cmd: List[str], env: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+    """
+    Run a `yc ... --format json` command and yield the items of the JSON array it prints.
+
+    When ijson is installed the output is parsed incrementally while the command
+    is still writing it, so a caller that stops iterating early does not wait for
+    (or buffer) the rest of the listing. Otherwise the whole output is parsed at once.
+
+    Args:
+        cmd: Command list to execute
+        env: Environment variables dictionary
+
+    Yields:
+        Items of the JSON array printed by the command
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero code
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Executing command: {' '.join(cmd)}")
+
+    if _ijson is None:
+        output = subprocess.check_output(cmd, env=env, stderr=subprocess.PIPE)
+        yield from _json.loads(output)
+        return
+
+    # stderr goes to a temporary file rather than a pipe: nobody reads it while
+    # stdout is streamed, so a chatty command could fill the pipe and block.
+    with tempfile.TemporaryFile() as stderr_file, \
+            subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=stderr_file) as process:
+        finished = False
+        try:
             try:
-                os.unlink(temp_file.name)
-            except Exception as e:
-                logger.warning(f"Failed to remove temporary file {temp_file.name}: {str(e)}")
+                yield from _ijson.items(process.stdout, "item")
+            except _ijson.JSONError:
+                # A failed command prints nothing parseable; report the exit code instead
+                if process.wait() == 0:
+                    raise
+            finished = True
+        finally:
+            # The caller stopped iterating early (or parsing failed): don't wait
+            # for the command to print the rest of the listing
+            if not finished and process.poll() is None:
+                process.terminate()
+        if process.wait() != 0:
+            stderr_file.seek(0)
+            raise subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr_file.read())
 
 
 def _run_yc_command(cmd, env):
@@ -548,7 +625,8 @@ def _run_yc_command(cmd, env):
         YandexCloudDBError: If command execution fails
     """
     try:
-        logger.debug(f"Executing YC command: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Executing YC command: {' '.join(cmd)}")
         result = subprocess.run(
             cmd,
             env=env,
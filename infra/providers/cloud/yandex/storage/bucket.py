@@ -1,15 +1,193 @@
 import logging
 import subprocess
-import json
-import tempfile
-import os
-import atexit
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
 
+from infra.config import Config
 from infra.project_setup.types import ProjectSetupContext
-from infra.providers.cloud.yandex.db.postgres import get_yc_configuration
+from infra.providers.cloud.yandex.db.postgres import get_yc_configuration, get_yc_env
 
 logger = logging.getLogger(__name__)
 
+# Yandex Object Storage S3-compatible endpoint
+S3_ENDPOINT_URL = "https://storage.yandexcloud.net"
+
+# Website settings applied to public buckets
+WEBSITE_INDEX_DOCUMENT = "index.html"
+WEBSITE_ERROR_DOCUMENT = "error.html"
+
+# Lazily created S3 client (see _get_s3_client); boto3 clients are thread-safe
+# once built, but building one is not, hence the lock
+_s3_client: Optional[Any] = None
+_s3_client_lock = threading.Lock()
+
+# S3 error codes meaning the access key itself is unusable; the yc CLI is tried instead
+S3_CREDENTIAL_ERROR_CODES = ("InvalidAccessKeyId", "SignatureDoesNotMatch")
+
+# How long (in seconds) a bucket existence result is reused
+BUCKET_EXISTS_CACHE_TTL = 60.0
+
+# Cache of existence checks: bucket_name -> (checked_at, exists)
+_bucket_exists_cache: Dict[str, Tuple[float, bool]] = {}
+
+# Lowercased stderr fragments with which `yc storage bucket get` reports a missing bucket
+BUCKET_NOT_FOUND_MARKERS = ("not found", "notfound", "nosuchbucket")
+
+
+def _get_s3_client() -> Optional[Any]:
+    """
+    Get a boto3 S3 client for Yandex Object Storage.
+
+    The client talks to the storage API directly over HTTPS instead of
+    starting a `yc` process per operation. It requires boto3 and a static
+    access key of the service account (YC_S3_ACCESS_KEY_ID and
+    YC_S3_SECRET_ACCESS_KEY); if either is missing, None is returned and
+    callers fall back to the yc CLI.
+
+    Returns:
+        The S3 client, or None if the S3 API cannot be used
+    """
+    global _s3_client
+
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = _create_s3_client()
+
+    return _s3_client
+
+
+def _create_s3_client() -> Optional[Any]:
+    """
+    Build the S3 client for _get_s3_client().
+
+    A dedicated boto3 session is used, as boto3's default session is shared
+    module state and not safe to use from several threads.
+
+    Returns:
+        The S3 client, or None if the S3 API cannot be used
+    """
+    access_key_id = Config.get("YC_S3_ACCESS_KEY_ID")
+    secret_access_key = Config.get("YC_S3_SECRET_ACCESS_KEY")
+    if not access_key_id or not secret_access_key:
+        logger.debug("YC_S3_ACCESS_KEY_ID/YC_S3_SECRET_ACCESS_KEY not set, using yc CLI for bucket operations")
+        return None
+
+    try:
+        import boto3
+        from botocore.exceptions import BotoCoreError
+    except ImportError:
+        logger.debug("boto3 is not installed, using yc CLI for bucket operations")
+        return None
+
+    try:
+        return boto3.session.Session().client(
+            "s3",
+            endpoint_url=S3_ENDPOINT_URL,
+            region_name="ru-central1",
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+        )
+    except BotoCoreError as e:
+        logger.warning("Could not create S3 client, using yc CLI for bucket operations: %s", e)
+        return None
+
+
+def _is_s3_credential_error(error: Exception) -> bool:
+    """
+    Tell whether an S3 API error means the client cannot be used at all.
+
+    Args:
+        error: A botocore BotoCoreError or ClientError.
+
+    Returns:
+        bool: True for missing or rejected credentials and connection errors.
+    """
+    from botocore.exceptions import ClientError
+
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code") in S3_CREDENTIAL_ERROR_CODES
+    # BotoCoreError: no credentials, endpoint unreachable, ...
+    return True
+
+
+def _create_bucket_s3(s3_client, bucket_name: str, public_read: bool) -> Optional[bool]:
+    """
+    Create a bucket through the S3 API and optionally configure it for website hosting.
+
+    Args:
+        s3_client: S3 client returned by _get_s3_client().
+        bucket_name: The name of the bucket to create.
+        public_read: If True, bucket will be public for read and serve a website.
+
+    Returns:
+        True if the bucket was created, False if creation failed, None if the
+        S3 API could not be used (credentials or connection) and the yc CLI
+        should be tried instead.
+    """
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    try:
+        if public_read:
+            s3_client.create_bucket(Bucket=bucket_name, ACL="public-read")
+        else:
+            s3_client.create_bucket(Bucket=bucket_name)
+        logger.info("Bucket '%s' created successfully via S3 API", bucket_name)
+    except (BotoCoreError, ClientError) as e:
+        if _is_s3_credential_error(e):
+            logger.warning("S3 API unavailable for bucket creation, falling back to yc CLI: %s", e)
+            return None
+        logger.error("Bucket creation via S3 API failed: %s", e)
+        return False
+
+    if public_read:
+        logger.info("Configuring bucket '%s' for website hosting...", bucket_name)
+        try:
+            s3_client.put_bucket_website(
+                Bucket=bucket_name,
+                WebsiteConfiguration={
+                    "IndexDocument": {"Suffix": WEBSITE_INDEX_DOCUMENT},
+                    "ErrorDocument": {"Key": WEBSITE_ERROR_DOCUMENT},
+                },
+            )
+            logger.info("Bucket '%s' configured successfully for website hosting.", bucket_name)
+        except (BotoCoreError, ClientError) as e:
+            logger.error("Bucket website configuration via S3 API failed: %s", e)
+            logger.warning("Website configuration failed for bucket '%s', but bucket was created.", bucket_name)
+
+    return True
+
+
+def _check_bucket_exists_s3(s3_client, bucket_name: str) -> Optional[bool]:
+    """
+    Check if a bucket exists with a single HEAD request through the S3 API.
+
+    Args:
+        s3_client: S3 client returned by _get_s3_client().
+        bucket_name: The name of the bucket to check.
+
+    Returns:
+        True if the bucket exists, False if it does not, None if the check failed.
+    """
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    try:
+        s3_client.head_bucket(Bucket=bucket_name)
+        logger.info("Bucket %s exists (confirmed with S3 HEAD request).", bucket_name)
+        return True
+    except ClientError as e:
+        error_code = e.response.get("Error", {}).get("Code")
+        if error_code in ("404", "NoSuchBucket"):
+            logger.info("Bucket %s does not exist.", bucket_name)
+            return False
+        logger.error("S3 HEAD request for bucket %s failed: %s", bucket_name, e)
+        return None
+    except BotoCoreError as e:
+        logger.error("S3 HEAD request for bucket %s failed: %s", bucket_name, e)
+        return None
+
+
 def create_bucket(ctx: 'ProjectSetupContext', bucket_name: str, public_read: bool = False) -> bool:
     """
     Creates a bucket in Yandex Cloud and optionally configures it for website hosting.
@@ -22,46 +200,77 @@ def create_bucket(ctx: 'ProjectSetupContext', bucket_name: str, public_read: boo
     Returns:
         bool: True if bucket creation and optional configuration was successful, False otherwise.
     """
-    logger.info(f"Creating Yandex Cloud bucket: {bucket_name} (public_read={public_read})")
+    logger.info("Creating Yandex Cloud bucket: %s (public_read=%s)", bucket_name, public_read)
+
+    s3_client = _get_s3_client()
+    if s3_client is not None:
+        created = _create_bucket_s3(s3_client, bucket_name, public_read)
+        if created is not None:
+            if created:
+                invalidate_bucket_cache(bucket_name)
+            return created
 
     # Get Yandex Cloud configuration with folder ID
     try:
         yc_config = get_yc_configuration()
         folder_id = yc_config.get("YC_FOLDER_ID")
 
-        # Setup environment for yc command
-        env = os.environ.copy()
-        temp_file = None
+        # Setup environment for yc command (credentials file is shared across calls)
+        env = get_yc_env(yc_config)
         success = False
 
-        try:
-            # Create temporary file to store the JSON credentials
-            temp_file = tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False)
-            temp_file.write(yc_config["YC_SA_JSON_CREDENTIALS"])
-            temp_file.flush()
-            temp_file.close()
-
-            # Set the path to our temporary JSON file
-            logger.debug(f"Using service account JSON credentials from temporary file: {temp_file.name}")
-            env["YC_SERVICE_ACCOUNT_KEY_FILE"] = temp_file.name
-
-            # Set cloud and folder IDs
-            env["YC_CLOUD_ID"] = yc_config["YC_CLOUD_ID"]
-            env["YC_FOLDER_ID"] = folder_id
-
-            # --- Step 1: Create bucket command ---
-            create_bucket_cmd = [
-                "yc", "storage", "bucket", "create",
-                bucket_name,
-                "--max-size", "1073741824",
-                "--folder-id", folder_id
+        # --- Step 1: Create bucket command ---
+        create_bucket_cmd = [
+            "yc", "storage", "bucket", "create",
+            bucket_name,
+            "--max-size", "1073741824",
+            "--folder-id", folder_id
+        ]
+        if public_read:
+            create_bucket_cmd.append("--public-read")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing create command: %s", ' '.join(create_bucket_cmd))
+        result_create = subprocess.run(
+            create_bucket_cmd,
+            env=env,
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+        if result_create.returncode != 0:
+            stderr_msg = result_create.stderr.strip() if result_create.stderr else "No error output"
+            stdout_msg = result_create.stdout.strip() if result_create.stdout else "No standard output"
+            logger.error("Bucket creation command failed with exit code %s", result_create.returncode)
+            logger.error("stderr: %s", stderr_msg)
+            logger.error("stdout: %s", stdout_msg)
+            return False # Exit if creation failed
+        else:
+            logger.info("Bucket '%s' created successfully in folder: %s", bucket_name, folder_id)
+            if result_create.stdout:
+                logger.debug("Create command stdout:\n%s", result_create.stdout.strip())
+            success = True # Mark creation as successful
+            invalidate_bucket_cache(bucket_name)
+
+        # --- Step 2: Configure website hosting if requested ---
+        # `yc storage bucket create` has no --website-settings flag, so the CLI
+        # path needs a second call; the S3 path above does both over one client.
+        if success and public_read:
+            logger.info("Configuring bucket '%s' for website hosting...", bucket_name)
+            # Construct the JSON string for website settings
+            website_settings_json = f'{{"index": "{WEBSITE_INDEX_DOCUMENT}", "error": "{WEBSITE_ERROR_DOCUMENT}"}}'
+
+            update_bucket_cmd = [
+                "yc", "storage", "bucket", "update",
+                "--name", bucket_name,
+                "--website-settings", website_settings_json # Use the correct flag and JSON
             ]
-            if public_read:
-                create_bucket_cmd.append("--public-read")
-
-            logger.debug(f"Executing create command: {' '.join(create_bucket_cmd)}")
-            result_create = subprocess.run(
-                create_bucket_cmd,
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Executing update command: %s", ' '.join(update_bucket_cmd))
+            result_update = subprocess.run(
+                update_bucket_cmd,
                 env=env,
                 check=False,
                 stdout=subprocess.PIPE,
@@ -69,176 +278,120 @@ def create_bucket(ctx: 'ProjectSetupContext', bucket_name: str, public_read: boo
                 text=True
             )
 
-            if result_create.returncode != 0:
-                stderr_msg = result_create.stderr.strip() if result_create.stderr else "No error output"
-                stdout_msg = result_create.stdout.strip() if result_create.stdout else "No standard output"
-                logger.error(f"Bucket creation command failed with exit code {result_create.returncode}")
-                logger.error(f"stderr: {stderr_msg}")
-                logger.error(f"stdout: {stdout_msg}")
-                return False # Exit if creation failed
+            if result_update.returncode != 0:
+                stderr_msg = result_update.stderr.strip() if result_update.stderr else "No error output"
+                stdout_msg = result_update.stdout.strip() if result_update.stdout else "No standard output"
+                logger.error("Bucket website configuration command failed with exit code %s", result_update.returncode)
+                logger.error("stderr: %s", stderr_msg)
+                logger.error("stdout: %s", stdout_msg)
+                logger.warning("Website configuration failed for bucket '%s', but bucket was created.", bucket_name)
             else:
-                logger.info(f"Bucket '{bucket_name}' created successfully in folder: {folder_id}")
-                if result_create.stdout:
-                    logger.debug(f"Create command stdout:\n{result_create.stdout.strip()}")
-                success = True # Mark creation as successful
-
-            # --- Step 2: Configure website hosting if requested ---
-            if success and public_read:
-                logger.info(f"Configuring bucket '{bucket_name}' for website hosting...")
-                # Construct the JSON string for website settings
-                website_settings_json = '{"index": "index.html", "error": "error.html"}'
-
-                update_bucket_cmd = [
-                    "yc", "storage", "bucket", "update",
-                    "--name", bucket_name,
-                    "--website-settings", website_settings_json # Use the correct flag and JSON
-                ]
-                logger.debug(f"Executing update command: {' '.join(update_bucket_cmd)}")
-                result_update = subprocess.run(
-                    update_bucket_cmd,
-                    env=env,
-                    check=False,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-
-                if result_update.returncode != 0:
-                    stderr_msg = result_update.stderr.strip() if result_update.stderr else "No error output"
-                    stdout_msg = result_update.stdout.strip() if result_update.stdout else "No standard output"
-                    logger.error(f"Bucket website configuration command failed with exit code {result_update.returncode}")
-                    logger.error(f"stderr: {stderr_msg}")
-                    logger.error(f"stdout: {stdout_msg}")
-                    logger.warning(f"Website configuration failed for bucket '{bucket_name}', but bucket was created.")
-                else:
-                    logger.info(f"Bucket '{bucket_name}' configured successfully for website hosting.")
-                    if result_update.stdout:
-                         logger.debug(f"Update command stdout:\n{result_update.stdout.strip()}")
-
-            return success # Return True if creation was successful (regardless of update status for now)
-
-        finally:
-            # Clean up the temporary file
-            if temp_file and os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
+                logger.info("Bucket '%s' configured successfully for website hosting.", bucket_name)
+                if result_update.stdout:
+                     logger.debug("Update command stdout:\n%s", result_update.stdout.strip())
+
+        return success # Return True if creation was successful (regardless of update status for now)
 
     except Exception as e:
-        logger.error(f"Failed during bucket creation/configuration: {str(e)}")
+        logger.error("Failed during bucket creation/configuration: %s", e)
         return False
 
 def check_bucket_exists(bucket_name: str) -> bool:
     """
     Checks if a bucket already exists in Yandex Cloud.
 
+    Successful answers are cached for BUCKET_EXISTS_CACHE_TTL seconds, so the
+    repeated checks made during one project setup hit the API only once.
+
     Args:
         bucket_name: The name of the bucket to check.
 
     Returns:
         bool: True if the bucket exists, False otherwise.
     """
-    logger.info(f"Checking if Yandex Cloud bucket exists: {bucket_name}")
+    logger.info("Checking if Yandex Cloud bucket exists: %s", bucket_name)
+
+    cached = _bucket_exists_cache.get(bucket_name)
+    if cached and time.monotonic() - cached[0] < BUCKET_EXISTS_CACHE_TTL:
+        logger.debug("Using cached existence result for bucket %s: %s", bucket_name, cached[1])
+        return cached[1]
+
+    exists = None
+    s3_client = _get_s3_client()
+    if s3_client is not None:
+        exists = _check_bucket_exists_s3(s3_client, bucket_name)
+    if exists is None:
+        # No S3 client, or the S3 check failed
+        exists = _check_bucket_exists_cli(bucket_name)
+
+    # Errors are reported as "does not exist" but never cached
+    if exists is None:
+        return False
 
-    try:
-        # Get Yandex Cloud configuration
-        yc_config = get_yc_configuration()
+    _bucket_exists_cache[bucket_name] = (time.monotonic(), exists)
+    return exists
 
-        # Setup environment for yc command
-        env = os.environ.copy()
-        temp_file = None
 
-        try:
-            # Create temporary file to store the JSON credentials
-            temp_file = tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False)
-            temp_file.write(yc_config["YC_SA_JSON_CREDENTIALS"])
-            temp_file.flush()
-            temp_file.close()
-
-            # Set the path to our temporary JSON file
-            env["YC_SERVICE_ACCOUNT_KEY_FILE"] = temp_file.name
-
-            # Set cloud and folder IDs
-            env["YC_CLOUD_ID"] = yc_config["YC_CLOUD_ID"]
-            env["YC_FOLDER_ID"] = yc_config["YC_FOLDER_ID"]
-
-            # Check specific bucket command - this works better than listing all buckets
-            check_specific_bucket_cmd = [
-                "yc", "storage", "bucket", "get",
-                bucket_name,
-                "--format", "json"
-            ]
+def invalidate_bucket_cache(bucket_name: str) -> None:
+    """
+    Forget the cached existence result for a bucket.
 
-            logger.debug(f"Executing direct bucket check command: {' '.join(check_specific_bucket_cmd)}")
-            result = subprocess.run(
-                check_specific_bucket_cmd,
-                env=env,
-                check=False,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+    Args:
+        bucket_name: The name of the bucket.
+    """
+    _bucket_exists_cache.pop(bucket_name, None)
 
-            # If the command succeeded, the bucket exists
-            if result.returncode == 0:
-                logger.info(f"Bucket {bucket_name} exists (confirmed with direct check).")
-                return True
 
-            # If we get here, the direct check didn't work, try listing all buckets
-            logger.debug(f"Direct bucket check failed, trying bucket list instead.")
+def _check_bucket_exists_cli(bucket_name: str) -> Optional[bool]:
+    """
+    Checks if a bucket exists using the yc CLI.
 
-            # List buckets command as fallback
-            list_buckets_cmd = [
-                "yc", "storage", "bucket", "list",
-                "--format", "json"
-            ]
+    Args:
+        bucket_name: The name of the bucket to check.
 
-            logger.debug(f"Executing fallback list buckets command: {' '.join(list_buckets_cmd)}")
-            result = subprocess.run(
-                list_buckets_cmd,
-                env=env,
-                check=False,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+    Returns:
+        True if the bucket exists, False if it does not, None if the check failed.
+    """
+    try:
+        # Get Yandex Cloud configuration
+        yc_config = get_yc_configuration()
 
-            if result.returncode != 0:
-                stderr_msg = result.stderr.strip() if result.stderr else "No error output"
-                stdout_msg = result.stdout.strip() if result.stdout else "No standard output"
-                logger.error(f"Bucket list command failed with exit code {result.returncode}")
-                logger.error(f"stderr: {stderr_msg}")
-                logger.error(f"stdout: {stdout_msg}")
-                return False
-
-            # Parse the JSON response and check for bucket
-            if not result.stdout.strip():
-                logger.warning("Empty response from bucket list command")
-                return False
-
-            try:
-                buckets = json.loads(result.stdout)
-                logger.debug(f"Found {len(buckets)} buckets in the listing")
-
-                # Log all bucket names for debugging
-                bucket_names = [b.get('name') for b in buckets if 'name' in b]
-                logger.debug(f"Bucket names in listing: {bucket_names}")
-
-                for bucket in buckets:
-                    if bucket.get('name') == bucket_name:
-                        logger.info(f"Bucket {bucket_name} exists (found in bucket list).")
-                        return True
-
-                logger.info(f"Bucket {bucket_name} not found in bucket list.")
-                return False
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse bucket list response as JSON: {e}")
-                logger.error(f"Response content: {result.stdout}")
-                return False
-
-        finally:
-            # Clean up the temporary file
-            if temp_file and os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
+        # Setup environment for yc command (credentials file is shared across calls)
+        env = get_yc_env(yc_config)
+
+        # Check the specific bucket - one call regardless of how many buckets the folder has
+        check_specific_bucket_cmd = [
+            "yc", "storage", "bucket", "get",
+            bucket_name,
+            "--format", "json"
+        ]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing direct bucket check command: %s", ' '.join(check_specific_bucket_cmd))
+        result = subprocess.run(
+            check_specific_bucket_cmd,
+            env=env,
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+        # If the command succeeded, the bucket exists
+        if result.returncode == 0:
+            logger.info("Bucket %s exists (confirmed with direct check).", bucket_name)
+            return True
+
+        # A missing bucket is reported on stderr; anything else is a real failure
+        stderr_msg = result.stderr.strip() if result.stderr else ""
+        if any(marker in stderr_msg.lower() for marker in BUCKET_NOT_FOUND_MARKERS):
+            logger.info("Bucket %s does not exist.", bucket_name)
+            return False
+
+        logger.error("Bucket get command failed with exit code %s", result.returncode)
+        logger.error("stderr: %s", stderr_msg or 'No error output')
+        return None
 
     except Exception as e:
-        logger.error(f"Error checking bucket existence: {str(e)}")
-        return False
\ No newline at end of file
+        logger.error("Error checking bucket existence: %s", e)
+        return None
\ No newline at end of file
@@ -2,7 +2,8 @@
 Git provider module for GitHub operations.
 """
 
-from .github import create_repository, setup_cicd
+from typing import Any
+
 from .local import (
     check_project_directory,
     create_project_directory,
@@ -11,6 +12,17 @@ from .local import (
     LocalGitError
 )
 
+# GitHub helpers pull in PyGithub, so they are imported on first access only
+_GITHUB_EXPORTS = ("create_repository", "setup_cicd")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _GITHUB_EXPORTS:
+        from . import github
+        return getattr(github, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "create_repository", 
     "setup_cicd",
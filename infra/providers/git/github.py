@@ -3,10 +3,14 @@ GitHub API integration module.
 """
 
 import logging
-import os
-from typing import Dict, List, Optional, TYPE_CHECKING
+import time
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote, urlparse, urlunparse
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 from github import Github, GithubException, Repository
+from nacl import encoding, public
 
 from infra.config import Config
 
@@ -16,6 +20,41 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of secrets uploaded to GitHub concurrently
+SECRET_UPLOAD_WORKERS = 8
+
+# Page size for paginated list requests (GitHub allows at most 100)
+GITHUB_PER_PAGE = 100
+
+# GraphQL query used by list_repositories; the affiliations match REST's /user/repos default
+_LIST_REPOSITORIES_QUERY = """
+query($cursor: String, $privacy: RepositoryPrivacy) {
+  viewer {
+    repositories(
+      first: 100,
+      after: $cursor,
+      privacy: $privacy,
+      ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]
+    ) {
+      pageInfo { endCursor hasNextPage }
+      nodes { name }
+    }
+  }
+}
+"""
+
+# How long (in seconds) secret and repository listings are reused
+LISTING_CACHE_TTL = 60.0
+
+# Cached listings: (token, repo_name) -> (fetched_at, secret names) and
+# (token, include_private) -> (fetched_at, repository names)
+_secrets_cache: Dict[Tuple[str, str], Tuple[float, FrozenSet[str]]] = {}
+_repos_cache: Dict[Tuple[str, bool], Tuple[float, List[str]]] = {}
+
+# Shared client, reused while the token stays the same (see get_github_client)
+_github_client: Optional[Github] = None
+_github_client_token: Optional[str] = None
+
 
 class GitHubError(Exception):
     """Exception raised for GitHub API errors."""
@@ -26,20 +65,52 @@ def get_github_client() -> Github:
     """
     Initialize and return a GitHub API client.
 
+    The client is created once per token and reused, so its connection pool
+    (and the TLS sessions in it) is kept across all GitHub operations.
+
     Returns:
         Github: Initialized GitHub client
 
     Raises:
         GitHubError: If authentication fails
     """
+    global _github_client, _github_client_token
+
     credentials = Config.get_github_credentials()
+    token = credentials["token"]
+    if _github_client is not None and _github_client_token == token:
+        return _github_client
+
     try:
-        return Github(credentials["token"])
+        _github_client = Github(
+            token,
+            per_page=GITHUB_PER_PAGE,
+            pool_size=SECRET_UPLOAD_WORKERS,
+        )
+        _github_client_token = token
+        return _github_client
     except Exception as e:
-        logger.error(f"Failed to initialize GitHub client: {str(e)}")
+        logger.error("Failed to initialize GitHub client: %s", e)
         raise GitHubError(f"GitHub authentication failed: {str(e)}")
 
 
+def _current_token() -> str:
+    """Return the configured GitHub token, used to key the listing caches."""
+    return Config.get_github_credentials()["token"]
+
+
+def reset_github_client() -> None:
+    """
+    Drop the shared GitHub client so the next get_github_client() call builds a new one.
+    """
+    global _github_client, _github_client_token
+
+    if _github_client is not None:
+        _github_client.close()
+    _github_client = None
+    _github_client_token = None
+
+
 def create_repository(
     name: str,
     private: bool = True,
@@ -64,65 +135,97 @@ def create_repository(
     client = get_github_client()
 
     try:
-        logger.info(f"Creating {'private' if private else 'public'} repository: {name}")
-        logger.debug(f"Repository creation details - name: {name}, private: {private}, auto_init: {auto_init}")
+        logger.info("Creating %s repository: %s", 'private' if private else 'public', name)
+        logger.debug("Repository creation details - name: %s, private: %s, auto_init: %s", name, private, auto_init)
 
-        # Check if repository already exists
         user = client.get_user()
-        logger.debug(f"Checking if repository '{name}' already exists for user: {user.login}")
-
-        for repo in user.get_repos():
-            if repo.name == name:
-                logger.info(f"Repository {name} already exists at {repo.html_url}")
-                return repo, True
-
-        # Create repository
-        repo = user.create_repo(
-            name=name,
-            private=private,
-            description=description or f"{name} project",
-            auto_init=auto_init
-        )
 
-        logger.debug(f"Repository created with id: {repo.id}, full name: {repo.full_name}")
-        logger.info(f"Repository created successfully at {repo.html_url}")
+        # Create first: for a new repository this is the only request; an
+        # existing one is reported with 422 and then fetched
+        try:
+            repo = user.create_repo(
+                name=name,
+                private=private,
+                description=description or f"{name} project",
+                auto_init=auto_init
+            )
+        except GithubException as e:
+            if not _is_name_taken_error(e):
+                raise
+            repo = user.get_repo(name)
+            logger.info("Repository %s already exists at %s", name, repo.html_url)
+            return repo, True
+
+        _repos_cache.clear()
+
+        logger.debug("Repository created with id: %s, full name: %s", repo.id, repo.full_name)
+        logger.info("Repository created successfully at %s", repo.html_url)
 
         return repo, False
 
     except GithubException as e:
-        logger.error(f"GitHub API error: {e.data.get('message', str(e))}")
+        logger.error("GitHub API error: %s", e.data.get('message', str(e)))
         raise GitHubError(f"Failed to create repository: {e.data.get('message', str(e))}")
     except Exception as e:
-        logger.error(f"Unexpected error creating repository: {str(e)}")
+        logger.error("Unexpected error creating repository: %s", e)
         raise GitHubError(f"Unexpected error: {str(e)}")
 
 
-def get_repository_secrets(repo_name: str) -> List[str]:
+def _is_name_taken_error(error: GithubException) -> bool:
     """
-    Get the list of existing secret names for a repository.
+    Check whether a repository creation error means the name is already in use.
+
+    Args:
+        error: Exception raised by create_repo
+
+    Returns:
+        True if GitHub rejected the name because such a repository exists
+    """
+    if error.status != 422 or not isinstance(error.data, dict):
+        return False
+    messages = [error.data.get("message", "")]
+    messages.extend(err.get("message", "") for err in error.data.get("errors", []) if isinstance(err, dict))
+    return any("already exists" in message for message in messages)
+
+
+def get_repository_secrets(
+    repo_name: str,
+    repo: Optional[Repository.Repository] = None
+) -> FrozenSet[str]:
+    """
+    Get the set of existing secret names for a repository.
 
     Args:
         repo_name: Repository name
+        repo: Already fetched repository object; if given, it is used instead
+            of looking the repository up again
 
     Returns:
-        List of secret names that already exist in the repository
+        Frozen set of secret names that already exist in the repository
 
     Raises:
         GitHubError: If there's an error getting repository secrets
     """
-    client = get_github_client()
-
     try:
-        repo = client.get_user().get_repo(repo_name)
+        cache_key = (_current_token(), repo_name)
+        cached = _secrets_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < LISTING_CACHE_TTL:
+            logger.debug("Using cached secret names for repository %s", repo_name)
+            return cached[1]
+
+        if repo is None:
+            repo = get_github_client().get_user().get_repo(repo_name)
         # Get all secrets (returns a generator of secret names)
         secrets = repo.get_secrets()
-        # Extract secret names and return as a list
-        return [secret.name for secret in secrets]
+        # Extract secret names into an immutable set for O(1) membership checks
+        secret_names = frozenset(secret.name for secret in secrets)
+        _secrets_cache[cache_key] = (time.monotonic(), secret_names)
+        return secret_names
     except GithubException as e:
-        logger.error(f"GitHub API error: {e.data.get('message', str(e))}")
+        logger.error("GitHub API error: %s", e.data.get('message', str(e)))
         raise GitHubError(f"Failed to get repository secrets: {e.data.get('message', str(e))}")
     except Exception as e:
-        logger.error(f"Unexpected error getting repository secrets: {str(e)}")
+        logger.error("Unexpected error getting repository secrets: %s", e)
         raise GitHubError(f"Unexpected error getting repository secrets: {str(e)}")
 
 
@@ -148,15 +251,46 @@ def set_repository_secret(repo_name: str, secret_name: str, secret_value: str) -
     try:
         repo = client.get_user().get_repo(repo_name)
         repo.create_secret(secret_name, secret_value)
-        logger.info(f"Set secret {secret_name} in repository {repo_name}")
+        _secrets_cache.pop((_current_token(), repo_name), None)
+        logger.info("Set secret %s in repository %s", secret_name, repo_name)
     except GithubException as e:
-        logger.error(f"GitHub API error: {str(e)}")
+        logger.error("GitHub API error: %s", e)
         raise GitHubError(f"Failed to set repository secret: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         raise GitHubError(f"Unexpected error: {str(e)}")
 
 
+def _secret_writer(repo: Repository.Repository) -> Callable[[str, str], None]:
+    """
+    Build a function that writes Actions secrets to a repository.
+
+    Repository.create_secret fetches the repository public key before every
+    write; here the key is fetched once and its sealed box is reused, so N
+    secrets take N + 1 requests instead of 2N.
+
+    Args:
+        repo: Repository to write secrets to
+
+    Returns:
+        Function taking a secret name and value
+    """
+    public_key = repo.get_public_key()
+    sealed_box = public.SealedBox(
+        public.PublicKey(public_key.key.encode("utf-8"), encoding.Base64Encoder)
+    )
+
+    def write_secret(secret_name: str, secret_value: str) -> None:
+        encrypted_value = b64encode(sealed_box.encrypt(secret_value.encode("utf-8"))).decode("utf-8")
+        repo.requester.requestJsonAndCheck(
+            "PUT",
+            f"{repo.url}/actions/secrets/{quote(secret_name, safe='')}",
+            input={"key_id": public_key.key_id, "encrypted_value": encrypted_value},
+        )
+
+    return write_secret
+
+
 def setup_cicd(
     repo_name: str,
     ctx: 'ProjectSetupContext', # Pass the context object
@@ -185,18 +319,25 @@ def setup_cicd(
         raise GitHubError("GitHub username is required for repository operations")
 
     try:
-        logger.info(f"Setting up CI/CD for repository: {repo_name}")
+        logger.info("Setting up CI/CD for repository: %s", repo_name)
 
         # Get the repository
         repo = client.get_user().get_repo(repo_name)
 
+        # Fetch the public key for writing secrets while existing secrets are listed
+        writer_future = None
+        if secrets or required_secret_names or ctx.github_secrets.get('DATABASE_URL'):
+            prefetch = ThreadPoolExecutor(max_workers=1)
+            writer_future = prefetch.submit(_secret_writer, repo)
+            prefetch.shutdown(wait=False)
+
         # Get existing secrets to avoid recreating them
         try:
-            existing_secrets = get_repository_secrets(repo_name)
-            logger.info(f"Found {len(existing_secrets)} existing secrets in repository")
+            existing_secrets = get_repository_secrets(repo_name, repo=repo)
+            logger.info("Found %s existing secrets in repository", len(existing_secrets))
         except Exception as e:
-            logger.warning(f"Could not get existing secrets: {str(e)}. Will attempt to create all required secrets.")
-            existing_secrets = []
+            logger.warning("Could not get existing secrets: %s. Will attempt to create all required secrets.", e)
+            existing_secrets = frozenset()
 
         # Combine explicitly passed secrets with secrets derived from context (like DB URL)
         all_secrets_to_set = {} if secrets is None else secrets.copy()
@@ -208,65 +349,119 @@ def setup_cicd(
             # an explicitly passed value if it differs (context takes precedence?)
             # Let's log if it was passed explicitly and differs.
             if "DATABASE_URL" in all_secrets_to_set and all_secrets_to_set["DATABASE_URL"] != db_url:
-                logger.warning(f"DATABASE_URL provided explicitly differs from context github_secrets. Using context value for repo {repo_name}.")
+                logger.warning("DATABASE_URL provided explicitly differs from context github_secrets. Using context value for repo %s.", repo_name)
             elif "DATABASE_URL" not in all_secrets_to_set:
-                logger.info(f"Adding DATABASE_URL from context github_secrets for {repo_name}")
+                logger.info("Adding DATABASE_URL from context github_secrets for %s", repo_name)
 
             all_secrets_to_set["DATABASE_URL"] = db_url
         else:
-            logger.debug(f"No DATABASE_URL found in context github_secrets for {repo_name}.")
+            logger.debug("No DATABASE_URL found in context github_secrets for %s.", repo_name)
 
         # Set up variables (GitHub Actions variables)
         if variables:
             for key, value in variables.items():
                 # Note: GitHub API doesn't directly support variables via PyGithub
-                logger.info(f"Setting variable: {key}")
+                logger.info("Setting variable: %s", key)
                 # Placeholder
 
-        # Set up secrets from the combined dictionary (explicit + context-derived)
-        if all_secrets_to_set:
-            for key, value in all_secrets_to_set.items():
-                if key in existing_secrets:
-                    # Check if the existing secret might need updating?
-                    # For now, we skip if it exists, assuming it's correct.
-                    # A more complex logic could compare values or force update.
-                    logger.info(f"Secret already exists: {key} (skipping)")
-                    continue
+        # Collect every (name, value) pair up front so they can be sent concurrently
+        secret_pairs: List[Tuple[str, str]] = []
+        for key, value in all_secrets_to_set.items():
+            if key in existing_secrets:
+                # Check if the existing secret might need updating?
+                # For now, we skip if it exists, assuming it's correct.
+                # A more complex logic could compare values or force update.
+                logger.info("Secret already exists: %s (skipping)", key)
+                continue
+            secret_pairs.append((key, value))
+
+        # Required secrets from Config (e.g., API keys)
+        optional_secret_names = set()
+        if required_secret_names:
+            # Names that already exist or are set above (e.g. DATABASE_URL)
+            skip = set(existing_secrets)
+            skip.update(all_secrets_to_set)
 
-                logger.info(f"Setting secret: {key}")
-                repo.create_secret(key, value)
+            # Load the configuration once for all required secrets
+            try:
+                config_values = Config.get_all()
+            except Exception as e:
+                logger.warning("Error loading config for required secrets: %s", e)
+                config_values = {}
 
-        # Set up required secrets from Config (e.g., API keys)
-        if required_secret_names:
             for secret_name in required_secret_names:
-                # Skip if secret already exists (might have been set above if DATABASE_URL was required)
-                if secret_name in existing_secrets or secret_name in all_secrets_to_set:
-                    logger.info(f"Required secret already exists or was just set: {secret_name} (skipping)")
+                if secret_name in skip:
+                    logger.info("Required secret already exists or was just set: %s (skipping)", secret_name)
                     continue
 
-                # Try to get the secret value from config
-                try:
-                    secret_value = Config.get(secret_name, default=None)
-                    if secret_value:
-                        logger.info(f"Setting required secret from config: {secret_name}")
-                        repo.create_secret(secret_name, secret_value)
-                    else:
-                        # If it wasn't in config and wasn't derivable from context (like DB URL was)
-                        logger.warning(f"Required secret not found in config: {secret_name}")
-                except Exception as e:
-                     logger.warning(f"Error retrieving required secret {secret_name} from config: {str(e)}")
-
-
-        logger.info(f"CI/CD setup completed for {repo_name}")
-
+                secret_value = config_values.get(secret_name)
+                if secret_value:
+                    secret_pairs.append((secret_name, secret_value))
+                    optional_secret_names.add(secret_name)
+                else:
+                    # If it wasn't in config and wasn't derivable from context (like DB URL was)
+                    logger.warning("Required secret not found in config: %s", secret_name)
+
+        # Each secret is a separate HTTPS round-trip, so send them in parallel
+        failed_secrets = []
+        if secret_pairs:
+            write_secret = writer_future.result() if writer_future else _secret_writer(repo)
+            with ThreadPoolExecutor(max_workers=min(SECRET_UPLOAD_WORKERS, len(secret_pairs))) as executor:
+                futures = {
+                    executor.submit(write_secret, key, value): key
+                    for key, value in secret_pairs
+                }
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        future.result()
+                        logger.info("Set secret: %s", key)
+                    except Exception as e:
+                        logger.warning("Failed to set secret %s: %s", key, e)
+                        # Secrets from Config are best-effort; explicit ones are not
+                        if key not in optional_secret_names:
+                            failed_secrets.append(key)
+
+        if secret_pairs:
+            _secrets_cache.pop((_current_token(), repo_name), None)
+
+        if failed_secrets:
+            raise GitHubError(f"Failed to set secrets: {', '.join(sorted(failed_secrets))}")
+
+        logger.info("CI/CD setup completed for %s", repo_name)
+
+    except GitHubError:
+        raise
     except GithubException as e:
-        logger.error(f"GitHub API error: {e.data.get('message', str(e))}")
+        logger.error("GitHub API error: %s", e.data.get('message', str(e)))
         raise GitHubError(f"Failed to set up CI/CD: {e.data.get('message', str(e))}")
     except Exception as e:
-        logger.error(f"Unexpected error setting up CI/CD: {str(e)}")
+        logger.error("Unexpected error setting up CI/CD: %s", e)
         raise GitHubError(f"Unexpected error setting up CI/CD: {str(e)}")
 
 
+def _graphql_url(base_url: str) -> str:
+    """
+    Derive the GraphQL endpoint from a REST API base URL.
+
+    github.com serves REST at https://api.github.com and GraphQL at /graphql;
+    GitHub Enterprise Server serves them at /api/v3 and /api/graphql.
+
+    Args:
+        base_url: REST API base URL of the client
+
+    Returns:
+        str: Absolute GraphQL endpoint URL
+    """
+    parsed = urlparse(base_url)
+    path = parsed.path.rstrip("/")
+    if path.endswith("/v3"):
+        path = path[:-len("/v3")] + "/graphql"
+    else:
+        path += "/graphql"
+    return urlunparse(parsed._replace(path=path))
+
+
 def list_repositories(include_private: bool = True) -> List[str]:
     """
     List all repositories accessible to the authenticated user.
@@ -280,21 +475,69 @@ def list_repositories(include_private: bool = True) -> List[str]:
     Raises:
         GitHubError: If listing repositories fails
     """
-    client = get_github_client()
-
     try:
-        logger.info("Listing repositories")
+        cache_key = (_current_token(), include_private)
+    except Exception as e:
+        logger.error("Failed to read GitHub credentials: %s", e)
+        raise GitHubError(f"GitHub authentication failed: {str(e)}")
+
+    cached = _repos_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < LISTING_CACHE_TTL:
+        logger.debug("Using cached repository list")
+        return list(cached[1])
 
-        repos = []
-        for repo in client.get_user().get_repos():
-            if include_private or not repo.private:
-                repos.append(repo.name)
+    repos = list(list_repositories_iter(include_private))
+    _repos_cache[cache_key] = (time.monotonic(), repos)
+    return list(repos)
 
-        return repos
 
+def list_repositories_iter(include_private: bool = True) -> Iterator[str]:
+    """
+    Yield the names of repositories accessible to the authenticated user.
+
+    Names are yielded page by page as they arrive, so a caller that stops
+    early (e.g. after finding a match) does not fetch the remaining pages.
+    Results are not cached; use list_repositories() for that.
+
+    Args:
+        include_private: Whether to include private repositories
+
+    Yields:
+        str: Repository name
+
+    Raises:
+        GitHubError: If listing repositories fails
+    """
+    client = get_github_client()
+
+    try:
+        logger.info("Listing repositories")
+        graphql_url = _graphql_url(client.requester.base_url)
+
+        # One GraphQL request per 100 repositories, fetching only the names
+        variables = {
+            "cursor": None,
+            "privacy": None if include_private else "PUBLIC",
+        }
+        while True:
+            _, data = client.requester.requestJsonAndCheck(
+                "POST", graphql_url, input={"query": _LIST_REPOSITORIES_QUERY, "variables": variables}
+            )
+            if data.get("errors"):
+                raise GitHubError(f"Failed to list repositories: {data['errors'][0].get('message')}")
+
+            page = data["data"]["viewer"]["repositories"]
+            for node in page["nodes"]:
+                yield node["name"]
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            variables["cursor"] = page["pageInfo"]["endCursor"]
+
+    except GitHubError:
+        raise
     except GithubException as e:
-        logger.error(f"GitHub API error: {e.data.get('message', str(e))}")
+        logger.error("GitHub API error: %s", e.data.get('message', str(e)))
         raise GitHubError(f"Failed to list repositories: {e.data.get('message', str(e))}")
     except Exception as e:
-        logger.error(f"Unexpected error listing repositories: {str(e)}")
-        raise GitHubError(f"Unexpected error listing repositories: {str(e)}")
\ No newline at end of file
+        logger.error("Unexpected error listing repositories: %s", e)
+        raise GitHubError(f"Unexpected error listing repositories: {str(e)}")
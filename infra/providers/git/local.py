@@ -5,18 +5,49 @@ Local Git operations module.
 import logging
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Set
 import re
 
 logger = logging.getLogger(__name__)
 
+# Regex pattern to find ${{ secrets.XXX }} references in workflow files
+_SECRET_RE = re.compile(r'\$\{\{\s*secrets\.([A-Za-z0-9_]+)\s*\}\}')
+
 
 class LocalGitError(Exception):
     """Exception raised for local Git operations errors."""
     pass
 
 
+# Variables passed through to git subprocesses besides GIT_*, LC_* and proxy settings
+_GIT_ENV_PASSTHROUGH = (
+    "PATH", "HOME", "USER", "LOGNAME", "LANG", "TERM", "TMPDIR", "XDG_CONFIG_HOME",
+    # ssh and gpg (commit signing); agent sockets often live under XDG_RUNTIME_DIR
+    "SSH_AUTH_SOCK", "SSH_AGENT_PID", "SSH_ASKPASS", "DISPLAY", "XDG_RUNTIME_DIR",
+    "GNUPGHOME", "GPG_TTY",
+    # Custom or corporate CA bundles for HTTPS pushes
+    "SSL_CERT_FILE", "SSL_CERT_DIR", "CURL_CA_BUNDLE",
+    # Windows
+    "SYSTEMROOT", "COMSPEC", "PATHEXT", "USERPROFILE", "USERNAME", "HOMEDRIVE", "HOMEPATH",
+    "APPDATA", "LOCALAPPDATA", "PROGRAMDATA", "TEMP", "TMP",
+)
+
+
+def _minimal_git_env() -> Dict[str, str]:
+    """
+    Build a small environment for git subprocesses instead of copying all of os.environ.
+
+    Returns:
+        Dict[str, str]: Environment with the variables git relies on
+    """
+    return {
+        key: value for key, value in os.environ.items()
+        if key in _GIT_ENV_PASSTHROUGH or key.startswith(("GIT_", "LC_")) or key.lower().endswith("_proxy")
+    }
+
+
 def check_project_directory(project_name: str, root_dir: str) -> tuple[Path, bool, bool]:
     """
     Check if the project directory exists and if it's empty.
@@ -38,21 +69,22 @@ def check_project_directory(project_name: str, root_dir: str) -> tuple[Path, boo
         # Expand tilde in path for home directory
         expanded_root = os.path.expanduser(root_dir)
         
-        # Create absolute Path object for the project directory
-        project_dir = Path(expanded_root).resolve() / project_name
+        # Build the absolute project directory path; work on plain strings and
+        # only wrap the result in a Path for the caller
+        project_dir_str = os.path.join(os.path.realpath(expanded_root), project_name)
         
         # Check if directory exists
-        exists = project_dir.exists()
+        exists = os.path.exists(project_dir_str)
         
         # Check if directory is empty (if it exists)
         is_empty = True
         if exists:
             # Directory is empty if it has no files and no subdirectories
-            # We exclude .git directory from this check
-            contents = [f for f in project_dir.iterdir() if f.name != '.git']
-            is_empty = len(contents) == 0
+            # We exclude .git directory from this check; stop at the first other entry
+            with os.scandir(project_dir_str) as entries:
+                is_empty = not any(entry.name != '.git' for entry in entries)
             
-        return project_dir, exists, is_empty
+        return Path(project_dir_str), exists, is_empty
         
     except Exception as e:
         logger.error(f"Error checking project directory: {str(e)}")
@@ -106,16 +138,18 @@ def populate_project_directory(
         # Get the project name from the directory path
         project_name = project_dir.name
         
-        # Get available templates
-        available_templates = list_available_templates()
-        
         # Шаблон должен быть явно указан
         if not template_name:
             raise LocalGitError("Template name must be specified")
             
         # Проверяем наличие шаблона
+        # The template list is scanned once and cached, so this check stays cheap
+        available_templates = list_available_templates()
         if template_name not in available_templates:
-            raise LocalGitError(f"Specified template '{template_name}' not found in available templates")
+            raise LocalGitError(
+                f"Specified template '{template_name}' not found in available templates: "
+                f"{', '.join(available_templates)}"
+            )
             
         template_to_use = template_name
         
@@ -200,10 +234,6 @@ def initialize_git_repository(
         LocalGitError: If there's an error initializing the repository
     """
     try:
-        # Change to project directory
-        cwd = os.getcwd()
-        os.chdir(project_dir)
-        
         # Get GitHub credentials
         from infra.config import Config
         credentials = Config.get_github_credentials()
@@ -214,11 +244,14 @@ def initialize_git_repository(
             logger.error("GitHub token not found in configuration")
             raise LocalGitError("GitHub token is required for Git operations")
         
-        # Prepare environment with GitHub credentials
-        git_env = os.environ.copy()
+        # Prepare environment with GitHub credentials, passing on only what git needs
+        git_env = _minimal_git_env()
         # Setting GIT_ASKPASS to 'echo' with token to avoid password prompts
         git_env["GIT_ASKPASS"] = "echo"
         git_env["GIT_TERMINAL_PROMPT"] = "0"
+        # Skip optional index locks and advice hints git would otherwise produce
+        git_env["GIT_OPTIONAL_LOCKS"] = "0"
+        git_env["GIT_ADVICE"] = "0"
         # Set username and password in environment for Git to use
         git_env["GIT_USERNAME"] = username
         git_env["GIT_PASSWORD"] = token
@@ -229,84 +262,77 @@ def initialize_git_repository(
         
         if not already_initialized:
             # Initialize repository
-            subprocess.run(["git", "init", "-b", branch], check=True, env=git_env)
+            subprocess.run(["git", "init", "--quiet", "-b", branch], check=True, env=git_env, cwd=project_dir)
             logger.info(f"Initialized Git repository in {project_dir}")
             
             # Configure Git credential helper to use environment variables
-            subprocess.run(["git", "config", "credential.helper", ""], check=True, env=git_env)
-            subprocess.run(["git", "config", "credential.helper", "env"], check=True, env=git_env)
+            subprocess.run(["git", "config", "credential.helper", "env"], check=True, env=git_env, cwd=project_dir)
             
             # Set up remote
             subprocess.run(
                 ["git", "remote", "add", "origin", remote_url], 
                 check=True,
-                env=git_env
+                env=git_env,
+                cwd=project_dir
             )
             logger.info(f"Added remote 'origin' pointing to {remote_url}")
             
             # Add all files
-            subprocess.run(["git", "add", "-A"], check=True, env=git_env)
+            subprocess.run(["git", "add", "-A"], check=True, env=git_env, cwd=project_dir)
             
-            # Check if there are changes to commit
+            # Check if there are changes to commit; the exit code says it all
+            # (1 if anything is staged), so no status output is captured.
+            # Works before the first commit too, unlike diff-index against HEAD.
             result = subprocess.run(
-                ["git", "status", "--porcelain"], 
-                capture_output=True, 
-                text=True,
-                check=True,
-                env=git_env
+                ["git", "diff", "--cached", "--quiet"],
+                env=git_env,
+                cwd=project_dir
             )
+            if result.returncode not in (0, 1):
+                raise subprocess.CalledProcessError(result.returncode, result.args)
             
-            if result.stdout.strip():
+            if result.returncode == 1:
                 # Make initial commit
                 subprocess.run(
-                    ["git", "commit", "-m", "Initial commit"], 
+                    ["git", "commit", "--quiet", "-m", "Initial commit"], 
                     check=True,
-                    env=git_env
+                    env=git_env,
+                    cwd=project_dir
                 )
                 logger.info("Created initial commit")
                 
                 # Push to remote
                 subprocess.run(
-                    ["git", "push", "-u", "origin", branch], 
+                    ["git", "push", "--quiet", "-u", "origin", branch], 
                     check=True,
-                    env=git_env
+                    env=git_env,
+                    cwd=project_dir
                 )
                 logger.info(f"Pushed to remote repository")
             else:
                 logger.info("No changes to commit")
         else:
             logger.info(f"Git repository already exists in {project_dir}")
-            
-            # Configure Git credential helper to use environment variables
-            subprocess.run(["git", "config", "credential.helper", ""], check=True, env=git_env)
-            subprocess.run(["git", "config", "credential.helper", "env"], check=True, env=git_env)
-            
-            # Check if remote exists
-            result = subprocess.run(
-                ["git", "remote"], 
-                capture_output=True, 
-                text=True, 
-                check=True,
-                env=git_env
-            )
-            
-            if "origin" in result.stdout.split():
-                # Update remote URL
-                subprocess.run(
-                    ["git", "remote", "set-url", "origin", remote_url], 
-                    check=True,
-                    env=git_env
-                )
-                logger.info(f"Updated remote URL")
-            else:
-                # Add remote if it doesn't exist
-                subprocess.run(
-                    ["git", "remote", "add", "origin", remote_url], 
-                    check=True,
-                    env=git_env
-                )
-                logger.info(f"Added remote 'origin' pointing to {remote_url}")
-            
+
+            # Update the repository config in-process via GitPython instead of
+            # spawning git for each query and change
+            from git import Repo
+            repo = Repo(project_dir)
+            with repo.config_writer() as config:
+                # Configure Git credential helper to use environment variables
+                config.set_value("credential", "helper", "env")
+
+                remote_section = 'remote "origin"'
+                if config.has_section(remote_section):
+                    # Update remote URL
+                    config.set_value(remote_section, "url", remote_url)
+                    logger.info(f"Updated remote URL")
+                else:
+                    # Add remote if it doesn't exist
+                    config.set_value(remote_section, "url", remote_url)
+                    config.set_value(remote_section, "fetch", "+refs/heads/*:refs/remotes/origin/*")
+                    logger.info(f"Added remote 'origin' pointing to {remote_url}")
+
         return not already_initialized
             
     except subprocess.CalledProcessError as e:
@@ -315,9 +341,6 @@ def initialize_git_repository(
     except Exception as e:
         logger.error(f"Error initializing Git repository: {str(e)}")
         raise LocalGitError(f"Error initializing Git repository: {str(e)}")
-    finally:
-        # Change back to original directory
-        os.chdir(cwd) 
 
 
 def find_github_secrets_in_workflow(project_dir: Path) -> Set[str]:
@@ -336,18 +359,19 @@ def find_github_secrets_in_workflow(project_dir: Path) -> Set[str]:
     if not github_dir.exists():
         return secrets
         
-    # Regex pattern to find secrets.XXX references in workflow files
-    secret_pattern = re.compile(r'\$\{\{\s*secrets\.([A-Za-z0-9_]+)\s*\}\}')
-    
     # Look for workflow files in GitHub Actions directory
     workflows_dir = github_dir / "workflows"
     if workflows_dir.exists():
-        for workflow_file in workflows_dir.glob("*.yml"):
-            with open(workflow_file, "r") as f:
-                content = f.read()
-                # Find all secret references
-                for match in secret_pattern.finditer(content):
-                    secret_name = match.group(1)
-                    secrets.add(secret_name)
+        # A flat listing is enough; DirEntry.is_file() needs no extra stat() call.
+        # GitHub accepts both .yml and .yaml workflow files.
+        with os.scandir(workflows_dir) as entries:
+            workflow_files = [
+                Path(entry.path) for entry in entries
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith(('.yml', '.yaml'))
+            ]
+        # Read the files concurrently; each worker returns the secret references it found
+        with ThreadPoolExecutor(max_workers=min(8, len(workflow_files) or 1)) as executor:
+            for found in executor.map(lambda path: _SECRET_RE.findall(path.read_text()), workflow_files):
+                secrets.update(found)
     
-    return secrets 
\ No newline at end of file
+    return secrets 
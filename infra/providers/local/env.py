@@ -3,11 +3,17 @@ Local environment file handling module.
 """
 
 import logging
+import os
+import re
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# One KEY=VALUE assignment per line; blank lines and '#' comments never match.
+# Whitespace around the key and the value is not part of the captures.
+_ENV_LINE_RE = re.compile(r'^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
 
 class EnvFileError(Exception):
     """Exception raised for .env file related errors."""
@@ -25,36 +31,45 @@ class ProjectEnv:
             env_file_path: Path to the .env file
         """
         self.env_file_path = env_file_path
+        # (st_mtime_ns, st_size, parsed variables) of the last read, see read()
+        self._cache: Optional[Tuple[int, int, Dict[str, str]]] = None
+        # (st_mtime_ns, st_size, content) of the last write, see _write()
+        self._last_written: Optional[Tuple[int, int, str]] = None
 
     def read(self) -> Dict[str, str]:
         """
         Read and parse the .env file into a dictionary.
 
+        The parsed result is reused until the file's modification time or size
+        changes, so repeated has_var/get_var/set_var calls parse it only once.
+
         Returns:
             Dictionary of environment variables
 
         Raises:
             EnvFileError: If the file cannot be read
         """
-        if not self.env_file_path.exists():
+        try:
+            stat = self.env_file_path.stat()
+        except FileNotFoundError:
             logger.debug(f".env file does not exist: {self.env_file_path}")
+            self._cache = None
             return {}
+        except OSError as e:
+            logger.error(f"Error reading .env file {self.env_file_path}: {str(e)}")
+            raise EnvFileError(f"Failed to read .env file: {str(e)}")
 
-        try:
-            env_vars = {}
-            content = self.env_file_path.read_text()
-
-            for line in content.splitlines():
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache[:2] == cache_key:
+            return dict(self._cache[2])
 
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
+        try:
+            # Parse the whole file with one regex scan instead of per-line string ops
+            env_vars = dict(_ENV_LINE_RE.findall(self.env_file_path.read_text()))
 
             logger.debug(f"Read {len(env_vars)} variables from {self.env_file_path}")
-            return env_vars
+            self._cache = (*cache_key, env_vars)
+            return dict(env_vars)
 
         except Exception as e:
             logger.error(f"Error reading .env file {self.env_file_path}: {str(e)}")
@@ -112,25 +127,40 @@ class ProjectEnv:
         Raises:
             EnvFileError: If there's an error writing to the file
         """
+        return self.set_vars({var_name: var_value})
+
+    def set_vars(self, updates: Dict[str, str]) -> bool:
+        """
+        Set or update several environment variables with one read and one write.
+
+        Args:
+            updates: Mapping of variable names to values
+
+        Returns:
+            True if successful, False otherwise
+
+        Raises:
+            EnvFileError: If there's an error writing to the file
+        """
+        if not updates:
+            return True
+
+        names = ", ".join(updates)
         try:
-            if self.env_file_path.exists():
-                # Read existing .env file
-                env_vars = self.read()
+            # Read existing .env file (empty if it doesn't exist yet)
+            env_vars = self.read()
 
-                # Update the variable
-                env_vars[var_name] = var_value
+            # Update the variables
+            env_vars.update(updates)
 
-                # Write back to the file
-                self._write(env_vars)
-            else:
-                # Create new .env file with the variable
-                self._write({var_name: var_value})
+            # Write back to the file
+            self._write(env_vars)
 
-            logger.debug(f"Set environment variable {var_name} in {self.env_file_path}")
+            logger.debug(f"Set environment variables {names} in {self.env_file_path}")
             return True
 
         except Exception as e:
-            logger.error(f"Error setting environment variable {var_name} in {self.env_file_path}: {str(e)}")
+            logger.error(f"Error setting environment variables {names} in {self.env_file_path}: {str(e)}")
             raise EnvFileError(f"Failed to set environment variable: {str(e)}")
 
     def remove_var(self, var_name: str) -> bool:
@@ -143,62 +173,101 @@ class ProjectEnv:
         Returns:
             True if the variable was removed, False if it didn't exist
 
+        Raises:
+            EnvFileError: If there's an error writing to the file
+        """
+        return self.remove_vars([var_name]) > 0
+
+    def remove_vars(self, var_names: Iterable[str]) -> int:
+        """
+        Remove several environment variables with one read and one write.
+
+        Args:
+            var_names: Names of the environment variables to remove
+
+        Returns:
+            Number of variables that existed and were removed
+
         Raises:
             EnvFileError: If there's an error writing to the file
         """
         if not self.env_file_path.exists():
-            return False
+            return 0
 
         try:
             # Read existing .env file
             env_vars = self.read()
 
-            # Check if the variable exists
-            if var_name not in env_vars:
-                return False
-
-            # Remove the variable
-            del env_vars[var_name]
+            # Remove the variables that exist
+            removed = [name for name in var_names if env_vars.pop(name, None) is not None]
+            if not removed:
+                return 0
 
             # Write back to the file
             self._write(env_vars)
 
-            logger.debug(f"Removed environment variable {var_name} from {self.env_file_path}")
-            return True
+            logger.debug(f"Removed environment variables {', '.join(removed)} from {self.env_file_path}")
+            return len(removed)
 
         except Exception as e:
-            logger.error(f"Error removing environment variable {var_name} from {self.env_file_path}: {str(e)}")
+            logger.error(f"Error removing environment variables from {self.env_file_path}: {str(e)}")
             raise EnvFileError(f"Failed to remove environment variable: {str(e)}")
 
     def _write(self, env_vars: Dict[str, str]) -> None:
         """
         Write environment variables to the .env file.
 
+        The content goes to a temporary file next to the .env file which then
+        replaces it, so an interrupted write never leaves a truncated file.
+        Nothing is written if the content is the same as the last write and
+        the file has not changed since.
+
         Args:
             env_vars: Dictionary of environment variables to write
 
         Raises:
             EnvFileError: If there's an error writing to the file
         """
+        # Generate .env file content
+        lines = [f"{key}={value}" for key, value in env_vars.items()]
+        content = "\n".join(lines) + "\n"
+
+        tmp_path = self.env_file_path.with_name(f".{self.env_file_path.name}.tmp{os.getpid()}")
         try:
+            try:
+                stat = self.env_file_path.stat()
+            except FileNotFoundError:
+                stat = None
+
+            if stat is not None and self._last_written == (stat.st_mtime_ns, stat.st_size, content):
+                logger.debug(f"{self.env_file_path} is unchanged, skipping write")
+                return
+
+            # Drop the cached parse; the next read() picks up the new content
+            self._cache = None
+
             # Create parent directories if they don't exist
             self.env_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Generate .env file content
-            lines = [f"{key}={value}" for key, value in env_vars.items()]
-            content = "\n".join(lines) + "\n"
+            # Write to a temporary file, keep the original permissions and swap it in
+            tmp_path.write_text(content)
+            if stat is not None:
+                os.chmod(tmp_path, stat.st_mode)
+            os.replace(tmp_path, self.env_file_path)
 
-            # Write to file
-            self.env_file_path.write_text(content)
+            stat = self.env_file_path.stat()
+            self._last_written = (stat.st_mtime_ns, stat.st_size, content)
             logger.debug(f"Wrote {len(env_vars)} variables to {self.env_file_path}")
 
         except Exception as e:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             logger.error(f"Error writing .env file {self.env_file_path}: {str(e)}")
             raise EnvFileError(f"Failed to write .env file: {str(e)}")
 
 
-
-
 # Backward compatibility functions
 def read_env_file(env_file_path: Path) -> Dict[str, str]:
     """Legacy function for backwards compatibility."""
@@ -14,6 +14,9 @@ class SimpleAIBot(AssistantBot):
     A minimal bot that forwards requests to the AI.
     """
 
+    # The /start reply never changes, so it is built once and reused
+    _WELCOME_ANSWER = SingleAnswer("Hello! I'm a simple AI bot.")
+
     async def get_answer_to_messages(self, messages, debug_info, do_interrupt) -> Answer:
         """
         Process incoming messages and forward to AI.
@@ -36,4 +39,4 @@ class SimpleAIBot(AssistantBot):
         :return: Welcome message
         :rtype: Answer
         """
-        return SingleAnswer("Hello! I'm a simple AI bot.")
+        return self._WELCOME_ANSWER
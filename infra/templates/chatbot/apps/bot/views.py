@@ -2,17 +2,21 @@
 API views
 """
 
-from rest_framework.decorators import api_view
-from rest_framework.response import Response
-from rest_framework.reverse import reverse
+import json
 
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
 
-@api_view(['GET'])
+# The root payload never changes, so it is serialized once at import time
+_API_ROOT_BODY = json.dumps({
+    'message': 'Welcome to the API',
+    'status': 'API is running successfully',
+}).encode()
+
+
+@require_GET
 def api_root(request, format=None):
     """
     API root endpoint
     """
-    return Response({
-        'message': 'Welcome to the API',
-        'status': 'API is running successfully',
-    })
+    return HttpResponse(_API_ROOT_BODY, content_type='application/json')
@@ -135,6 +135,9 @@ STATIC_ROOT = BASE_DIR / 'static'
 # Media files (User uploaded files)
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+# Django's static() serve view is slow; development serves media by default,
+# set SERVE_MEDIA=False to leave it to a separate file server
+SERVE_MEDIA = env.bool('SERVE_MEDIA', default=DEBUG)
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
@@ -150,8 +153,26 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 10,
 }
 
+# Cache settings: Redis when REDIS_URL is set, in-process memory otherwise
+REDIS_URL = env.str('REDIS_URL', default='')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 
 # Logging configuration
+LOG_LEVEL = env.str('LOG_LEVEL', default='INFO')
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -174,22 +195,28 @@ LOGGING = {
     },
     'root': {
         'handlers': ['console'],
-        'level': 'DEBUG' if DEBUG else 'INFO',
+        'level': LOG_LEVEL,
     },
     'loggers': {
         'django': {
             'handlers': ['console'],
-            'level': 'DEBUG' if DEBUG else 'INFO',
+            'level': LOG_LEVEL,
+            'propagate': False,
+        },
+        # SQL queries are logged at DEBUG; keep them quiet unless asked for explicitly
+        'django.db.backends': {
+            'handlers': ['console'],
+            'level': env.str('DB_LOG_LEVEL', default='WARNING'),
             'propagate': False,
         },
         'bot': {
             'handlers': ['console'],
-            'level': 'DEBUG' if DEBUG else 'INFO',
+            'level': LOG_LEVEL,
             'propagate': False,
         },
         'assistant': {
             'handlers': ['console'],
-            'level': 'DEBUG' if DEBUG else 'INFO',
+            'level': LOG_LEVEL,
             'propagate': False,
         },
     },
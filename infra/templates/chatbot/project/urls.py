@@ -16,6 +16,6 @@ urlpatterns = [
     path('', include('assistant.assistant.urls')),
 ]
 
-# Serve media files in development
-if settings.DEBUG:
+# Serve media files through Django only in development and only when asked to (SERVE_MEDIA)
+if settings.DEBUG and settings.SERVE_MEDIA:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
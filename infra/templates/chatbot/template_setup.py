@@ -5,13 +5,13 @@ Template-specific environment setup script for the 'webapp' template.
 import logging
 import os  # Add os import for path joining
 from pathlib import Path # Import Path
-import copy # Import copy
 import secrets
-import string
+from concurrent.futures import ThreadPoolExecutor
 from infra.project_setup.environment import (
     setup_python_environment,
     setup_database,
-    setup_bucket
+    setup_bucket,
+    synchronized_log_func
 )
 from infra.project_setup.types import ProjectSetupContext
 import subprocess
@@ -59,20 +59,21 @@ def _setup_backend(ctx: 'ProjectSetupContext') -> str:
     ctx.github_secrets['SITE_URL'] = f"https://{project_name}.website.yandexcloud.net"
 
 
-    # Create Yandex Cloud bucket for Django static files using environment module
+    # Create Yandex Cloud bucket for Django static files using environment module;
+    # it updates ctx, so it runs here rather than next to the steps below
     bucket_name = f"{project_name}-static"
     result = setup_bucket(ctx, bucket_name, public_read=True)
     logger.info(f"Bucket creation attempt for {bucket_name}: {'successful' if result else 'failed or bucket already exists'}.")
 
-
     # Add local development variables to project_env
     local_env = ProjectEnv(Path(ctx.project_dir) / '.env')
-    local_env.set_var('CORS_ALLOWED_ORIGINS', "http://localhost:3000")
-    local_env.set_var('SITE_URL', "http://localhost:8000")
+    local_env.set_vars({
+        'CORS_ALLOWED_ORIGINS': "http://localhost:3000",
+        'SITE_URL': "http://localhost:8000",
+    })
 
-    # Generate Django Secret Key - using only safe characters
-    safe_chars = string.ascii_letters + string.digits + '-_!@#$%^&*()[]{}|;:,.<>?'
-    django_key = ''.join(secrets.choice(safe_chars) for i in range(50))
+    # Generate Django Secret Key - URL-safe characters only, ~50 chars from one urandom read
+    django_key = secrets.token_urlsafe(38)
     ctx.github_secrets['DJANGO_SECRET_KEY'] = django_key
 
     logger.info(f"Set YC infrastructure secrets and generated Django key for project: {project_name}")
@@ -81,25 +82,29 @@ def _setup_backend(ctx: 'ProjectSetupContext') -> str:
     backend_dir = Path(ctx.project_dir)
     logger.info(f"Backend directory is {backend_dir}.")
 
-    # Create a context specific to the backend setup
-    backend_ctx = copy.deepcopy(ctx)
-    backend_ctx.project_dir = backend_dir # Update project_dir
+    # Create a context specific to the backend setup; both steps below log through it
+    backend_ctx = ctx.with_project_dir(backend_dir)
     backend_ctx.project_env = local_env.read()
+    backend_ctx.log_func = synchronized_log_func(ctx.log_func)
     logger.debug(f"Created backend-specific context with project_dir: {backend_ctx.project_dir}")
 
-    # 1. Set up Backend Python virtual environment using the backend context
-    logger.info("Setting up Python environment for backend.")
-    setup_python_environment(backend_ctx)
+    # The virtual environment and the database are independent, so set them up concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # 1. Set up Backend Python virtual environment using the backend context
+        logger.info("Setting up Python environment for backend.")
+        venv_future = executor.submit(setup_python_environment, backend_ctx)
+
+        # 2. Create database if needed, using the backend context
+        logger.debug("Checking if database creation is needed (using backend context)")
+        database_future = executor.submit(setup_database, backend_ctx)
 
-    # 2. Create database if needed, using the backend context
-    logger.debug("Checking if database creation is needed (using backend context)")
-    setup_database(backend_ctx)
+        venv_future.result()
+        database_future.result()
 
     if 'DATABASE_URL' in backend_ctx.github_secrets:
         ctx.github_secrets['DATABASE_URL'] = backend_ctx.github_secrets['DATABASE_URL']
 
-    for k, v in backend_ctx.project_env.items():
-        local_env.set_var(k, v)
+    local_env.set_vars(backend_ctx.project_env)
 
     logger.debug("Backend setup finished.")
 
@@ -2,12 +2,14 @@
 Project template generator for creating boilerplate projects.
 """
 
+import functools
 import logging
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import jinja2
 from git import Repo
@@ -29,22 +31,96 @@ def list_available_templates() -> List[str]:
     Returns:
         List[str]: List of template names
     """
+    return list(_scan_templates())
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_templates() -> Tuple[str, ...]:
+    """
+    Scan the templates directory once; the set of templates does not change at runtime.
+
+    Returns:
+        Tuple[str, ...]: Template names
+    """
     # Get templates from physical directories
     base_dir = Path(__file__).parent
-    logger.debug(f"Templates base directory: {base_dir}")
+    logger.debug("Templates base directory: %s", base_dir)
 
     # Find all directories that don't start with underscore
-    physical_templates = [d.name for d in base_dir.iterdir()
-                         if d.is_dir() and not d.name.startswith('__')]
-    logger.debug(f"Template directories found: {physical_templates}")
+    physical_templates = tuple(d.name for d in base_dir.iterdir()
+                               if d.is_dir() and not d.name.startswith('__'))
+    logger.debug("Template directories found: %s", physical_templates)
 
     # Use only physically present templates
     templates = physical_templates
 
-    logger.debug(f"Available templates: {templates}")
+    logger.debug("Available templates: %s", templates)
     return templates
 
 
+def _copy_template_file(src: str, dst: str) -> str:
+    """
+    Copy a template file into a generated project.
+
+    Unlike shutil.copy2, timestamps and other metadata are not copied, only
+    the permission bits (so executable scripts stay executable). copyfile
+    uses the kernel's zero-copy fast path where the platform has one.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        str: Destination file path
+    """
+    shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+    return dst
+
+
+def _copy_template_tree(template_dir: Path, project_dir: Path, dirs_exist_ok: bool = False) -> None:
+    """
+    Copy a template directory into a project directory, copying files concurrently.
+
+    The tree is walked serially and each file copy is handed to a thread pool,
+    since the copies are independent and I/O bound. A directory's metadata is
+    only copied once all of its files are written, so read-only template
+    directories (e.g. an installed package) don't make the destination
+    read-only while copies into it are still running.
+
+    Args:
+        template_dir: Template directory to copy
+        project_dir: Destination project directory
+        dirs_exist_ok: Whether the destination directory may already exist
+    """
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+
+        def copy_dir(src: str, dst: str) -> None:
+            os.makedirs(dst, exist_ok=dirs_exist_ok)
+
+            futures = []
+            subdirs = []
+            with os.scandir(src) as entries:
+                for entry in entries:
+                    dst_path = os.path.join(dst, entry.name)
+                    # Symlinks are followed, as shutil.copytree does by default
+                    if entry.is_dir():
+                        subdirs.append((entry.path, dst_path))
+                    else:
+                        futures.append(executor.submit(_copy_template_file, entry.path, dst_path))
+
+            for sub_src, sub_dst in subdirs:
+                copy_dir(sub_src, sub_dst)
+
+            # Surface the first copy error, if any, before the directory metadata is set
+            for future in futures:
+                future.result()
+            shutil.copystat(src, dst)
+
+        copy_dir(str(template_dir), str(project_dir))
+
+
+@functools.lru_cache(maxsize=None)
 def _get_template_path(template_name: str) -> Path:
     """
     Get the path to a template directory.
@@ -60,14 +136,15 @@ def _get_template_path(template_name: str) -> Path:
     """
     # Base directory for templates
     base_dir = Path(__file__).parent
-    logger.debug(f"Looking for template '{template_name}' in base directory: {base_dir}")
+    logger.debug("Looking for template '%s' in base directory: %s", template_name, base_dir)
 
     # Check if template directory exists
     template_dir = base_dir / template_name
-    logger.debug(f"Template directory path: {template_dir}, exists: {template_dir.exists()}")
+    exists = template_dir.exists()
+    logger.debug("Template directory path: %s, exists: %s", template_dir, exists)
 
-    if template_dir.exists():
-        logger.debug(f"Template found at: {template_dir}")
+    if exists:
+        logger.debug("Template found at: %s", template_dir)
         return template_dir
 
     # If not, raise an error
@@ -160,13 +237,13 @@ def generate_boilerplate(
         # Copy template to project directory
         if force_existing_dir and project_dir.exists():
             # Just copy all files directly
-            logger.debug(f"Using existing directory: {project_dir}")
+            logger.debug("Using existing directory: %s", project_dir)
             # Use shutil.copytree with dirs_exist_ok=True to copy into existing directory
-            shutil.copytree(template_dir, project_dir, dirs_exist_ok=True)
+            _copy_template_tree(template_dir, project_dir, dirs_exist_ok=True)
         else:
             # Create a new directory with the template
-            logger.debug(f"Creating new directory: {project_dir}")
-            shutil.copytree(template_dir, project_dir)
+            logger.debug("Creating new directory: %s", project_dir)
+            _copy_template_tree(template_dir, project_dir)
 
         # Initialize Git repository if requested
         if initialize_git:
@@ -182,7 +259,7 @@ def generate_boilerplate(
         logger.error(f"Failed to generate boilerplate: {str(e)}")
         # Clean up if project directory was created
         if project_dir.exists():
-            logger.debug(f"Cleaning up project directory: {project_dir}")
+            logger.debug("Cleaning up project directory: %s", project_dir)
             shutil.rmtree(project_dir)
             # Get original exception's stack trace but create new exception with updated message
             if isinstance(e, FileExistsError) and str(e).find(str(project_dir)) >= 0:
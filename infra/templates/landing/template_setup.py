@@ -2,7 +2,6 @@
 Template-specific environment setup script for the 'landing' template.
 """
 
-import copy
 import logging
 from pathlib import Path
 import secrets
@@ -32,8 +31,7 @@ def setup(ctx: 'ProjectSetupContext') -> None:
 
     # Setup minimal frontend environment (if needed)
     frontend_dir = Path(ctx.project_dir) / 'frontend'
-    frontend_ctx = copy.deepcopy(ctx)
-    frontend_ctx.project_dir = frontend_dir
+    frontend_ctx = ctx.with_project_dir(frontend_dir)
 
     setup_frontend_environment(frontend_ctx)
     if frontend_ctx.public_url:
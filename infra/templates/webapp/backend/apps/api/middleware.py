@@ -0,0 +1,22 @@
+from django.middleware.csrf import get_token
+
+# Responses under these paths always carry the CSRF cookie, so the SPA can
+# pick it up from the user details request it makes on every page load
+CSRF_COOKIE_PATH_PREFIXES = ('/api/v1/auth/user/',)
+
+
+class EnsureCSRFCookieMiddleware:
+    """
+    Sets the CSRF cookie for CSRF_COOKIE_PATH_PREFIXES, like ensure_csrf_cookie
+    would, without wrapping the views themselves.
+
+    Must come after django.middleware.csrf.CsrfViewMiddleware in MIDDLEWARE.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path.startswith(CSRF_COOKIE_PATH_PREFIXES):
+            get_token(request)
+        return self.get_response(request)
@@ -14,6 +14,4 @@ class UserDetailsSerializer(serializers.ModelSerializer):
 
     def get_csrfToken(self, obj):
         request = self.context.get('request')
-        if request and hasattr(request, 'META'):
-            return request.META.get('CSRF_COOKIE', '')
-        return ''
\ No newline at end of file
+        return request.META.get('CSRF_COOKIE', '') if request is not None else ''
\ No newline at end of file
@@ -3,27 +3,168 @@ from rest_framework.response import Response
 from rest_framework import status
 from dj_rest_auth.views import UserDetailsView as DefaultUserDetailsView
 from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import ensure_csrf_cookie
 from allauth.socialaccount.providers.google.views import GoogleOAuth2Adapter
 from allauth.socialaccount.providers.oauth2.client import OAuth2Client
 from dj_rest_auth.registration.views import SocialLoginView
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.utils import OperationalError
 from django.http import HttpResponse
 from rest_framework.exceptions import AuthenticationFailed
 import requests
+from google.auth import exceptions as google_auth_exceptions
+from google.auth import jwt as google_jwt
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
 import json
 import logging
+import re
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+GOOGLE_TOKENINFO_URL = "https://oauth2.googleapis.com/tokeninfo"
+# PEM certificates Google signs ID tokens with, keyed by key id
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+# Used when the certs response has no Cache-Control max-age
+GOOGLE_CERTS_DEFAULT_TTL = 3600
+
+# Expected audience of Google ID tokens; settings don't change at runtime
+GOOGLE_CLIENT_ID = settings.SOCIALACCOUNT_PROVIDERS['google']['APP']['client_id']
+
+# Shared session so tokeninfo requests reuse keep-alive HTTPS connections
+_google_session = requests.Session()
+_google_session.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+))
+
+# Verified Google tokeninfo responses, keyed by the SHA-256 of the ID token:
+# token hash -> (token_info, expires_at). Entries live at most TOKENINFO_CACHE_TTL
+# seconds and never past the token's own expiry; the oldest go first when full.
+TOKENINFO_CACHE_TTL = 300
+TOKENINFO_CACHE_MAX_SIZE = 10_000
+_tokeninfo_cache = {}
+_tokeninfo_cache_lock = threading.Lock()
+
+# How long (in seconds) a successful health-check database probe is reused
+HEALTH_CHECK_DB_CACHE_KEY = "healthz:db"
+HEALTH_CHECK_DB_CACHE_TTL = 2
+
+
+def _get_cached_token_info(token_key):
+    with _tokeninfo_cache_lock:
+        cached = _tokeninfo_cache.get(token_key)
+        if cached is None:
+            return None
+        token_info, expires_at = cached
+        if expires_at <= time.time():
+            del _tokeninfo_cache[token_key]
+            return None
+        return token_info
+
+
+def _cache_token_info(token_key, token_info):
+    try:
+        token_exp = float(token_info['exp'])
+    except (KeyError, TypeError, ValueError):
+        return
+    expires_at = min(time.time() + TOKENINFO_CACHE_TTL, token_exp)
+    with _tokeninfo_cache_lock:
+        # Dicts keep insertion order, so the first keys are the oldest entries
+        while len(_tokeninfo_cache) >= TOKENINFO_CACHE_MAX_SIZE:
+            del _tokeninfo_cache[next(iter(_tokeninfo_cache))]
+        _tokeninfo_cache[token_key] = (token_info, expires_at)
+
+
+# Google signing certificates and when they stop being fresh, see _get_google_certs()
+_google_certs = None
+_google_certs_expire_at = 0.0
+_google_certs_lock = threading.Lock()
+
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+
+def _get_google_certs():
+    """
+    Return Google's ID token signing certificates, refetching them only after
+    the max-age the certs endpoint advertises.
+    """
+    global _google_certs, _google_certs_expire_at
+
+    with _google_certs_lock:
+        if _google_certs is None or _google_certs_expire_at <= time.time():
+            resp = _google_session.get(GOOGLE_CERTS_URL, timeout=(3, 5))
+            resp.raise_for_status()
+            match = _MAX_AGE_RE.search(resp.headers.get('Cache-Control', ''))
+            max_age = int(match.group(1)) if match else GOOGLE_CERTS_DEFAULT_TTL
+            _google_certs = resp.json()
+            _google_certs_expire_at = time.time() + max_age
+        return _google_certs
+
+
+def _verify_id_token_locally(id_token):
+    """
+    Verify a Google ID token's signature, expiry, audience and issuer without
+    calling tokeninfo.
+
+    Returns:
+        The token claims, or None if the token could not be verified locally.
+    """
+    try:
+        claims = google_jwt.decode(id_token, certs=_get_google_certs(), audience=GOOGLE_CLIENT_ID)
+    except (ValueError, requests.RequestException, google_auth_exceptions.GoogleAuthError) as e:
+        logger.info("Local ID token verification failed, falling back to tokeninfo: %s", e)
+        return None
+
+    if claims.get('iss') not in GOOGLE_ISSUERS:
+        logger.warning("ID token has unexpected issuer: %s", claims.get('iss'))
+        return None
+    return claims
+
+
+def _database_is_available():
+    """
+    Check that the database answers a trivial query.
+
+    A successful probe is reused for HEALTH_CHECK_DB_CACHE_TTL seconds so
+    frequent load balancer checks don't hit the database every time; failures
+    are not cached and show up on the next probe.
+    """
+    if cache.get(HEALTH_CHECK_DB_CACHE_KEY):
+        return True
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+    except OperationalError as e:
+        logger.warning("Health check database probe failed: %s", e)
+        return False
+    cache.set(HEALTH_CHECK_DB_CACHE_KEY, True, HEALTH_CHECK_DB_CACHE_TTL)
+    return True
+
 
 class HealthCheckView(APIView):
     """
-    A simple health check endpoint to test if the API is running.
+    A simple health check endpoint to test if the API and its database are running.
     """
     permission_classes = []  # Allow unauthenticated access
+    authentication_classes = []  # Skip session lookups on every probe
 
+    @method_decorator(cache_control(no_store=True))
     def get(self, request, format=None):
+        if not _database_is_available():
+            return Response(
+                {"status": "error", "message": "Database is unavailable"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
         return Response(
             {"status": "ok", "message": "API is running"},
             status=status.HTTP_200_OK
@@ -43,33 +184,51 @@ class CustomGoogleOAuth2Adapter(GoogleOAuth2Adapter):
             # Extract the id_token if available
             id_token = kwargs.get('response', {}).get('id_token')
             if id_token:
-                logger.info(f"Using provided ID token for Google authentication")
-
-                # Custom handling for ID token verification
-                resp = requests.get(
-                    f"https://oauth2.googleapis.com/tokeninfo?id_token={id_token}"
-                )
-
-                if resp.status_code == 200:
-                    token_info = resp.json()
-
-                    # Verify the token is intended for our app
-                    if 'aud' in token_info and token_info['aud'] == settings.SOCIALACCOUNT_PROVIDERS['google']['APP']['client_id']:
-                        # Create social login data from token info
-                        login_data = {
-                            'email': token_info.get('email'),
-                            'first_name': token_info.get('given_name', ''),
-                            'last_name': token_info.get('family_name', ''),
-                            'id': token_info.get('sub'),
-                            'verified_email': token_info.get('email_verified', False),
-                        }
-                        return self.get_provider().sociallogin_from_response(request, login_data)
-
-            # Fall back to standard method if no ID token or verification failed
+                logger.info("Using provided ID token for Google authentication")
+
+                # Reuse a recent verification of the same token, if any
+                token_key = hashlib.sha256(id_token.encode()).hexdigest()
+                token_info = _get_cached_token_info(token_key)
+                from_cache = token_info is not None
+
+                if not from_cache:
+                    # Verify the JWT locally against Google's cached signing certs
+                    token_info = _verify_id_token_locally(id_token)
+
+                if token_info is None:
+                    # Custom handling for ID token verification
+                    resp = _google_session.get(
+                        GOOGLE_TOKENINFO_URL,
+                        params={'id_token': id_token},
+                        timeout=(3, 5),
+                    )
+                    if resp.status_code == 200:
+                        token_info = resp.json()
+
+                if token_info is not None:
+                    # A valid ID token issued for another app is rejected outright;
+                    # the standard flow would only ask Google about it once more
+                    if token_info.get('aud') != GOOGLE_CLIENT_ID:
+                        raise AuthenticationFailed('Invalid audience')
+                    # Only verified tokens for our app are cached
+                    if not from_cache:
+                        _cache_token_info(token_key, token_info)
+                    # Create social login data from token info
+                    login_data = {
+                        'email': token_info.get('email'),
+                        'first_name': token_info.get('given_name', ''),
+                        'last_name': token_info.get('family_name', ''),
+                        'id': token_info.get('sub'),
+                        'verified_email': token_info.get('email_verified', False),
+                    }
+                    return self.get_provider().sociallogin_from_response(request, login_data)
+
+            # Fall back to standard method if there is no ID token or the credential
+            # is not one (GoogleLoginView passes access tokens in as id_token too)
             logger.info("Falling back to standard OAuth2 flow")
             return super().complete_login(request, app, token, **kwargs)
         except Exception as e:
-            logger.exception(f"Error in Google OAuth: {str(e)}")
+            logger.exception("Error in Google OAuth: %s", e)
             raise
 
 
@@ -83,28 +242,25 @@ class GoogleLoginView(SocialLoginView):
         Enhanced method for handling Google ID tokens and OAuth flows
         """
         try:
+            data = request.data
+
             # Log request data for debugging (without sensitive info)
-            logger.info(f"Google login request received with keys: {request.data.keys()}")
+            logger.info("Google login request received with keys: %s", list(data.keys()))
 
             # Get credential from different possible fields
-            credential = request.data.get('credential',
-                         request.data.get('id_token',
-                         request.data.get('access_token')))
+            credential = data.get('credential') or data.get('id_token') or data.get('access_token')
 
             if not credential:
                 logger.warning("No Google credential found in request")
                 raise AuthenticationFailed('No valid Google credential provided')
 
             # Update request data for compatibility with both ID token and access token flows
-            request.data.update({
-                'access_token': credential,
-                'id_token': credential,
-                'response': {'id_token': credential}  # For our custom adapter
-            })
+            data['access_token'] = data['id_token'] = credential
+            data['response'] = {'id_token': credential}  # For our custom adapter
 
             return super().post(request, *args, **kwargs)
         except Exception as e:
-            logger.exception(f"Google authentication error: {str(e)}")
+            logger.exception("Google authentication error: %s", e)
             return Response({
                 'error': str(e),
                 'detail': 'Failed to authenticate with Google'
@@ -0,0 +1,26 @@
+"""
+Gunicorn configuration for project.
+
+Gunicorn picks this file up automatically from the working directory;
+the command line options in the Dockerfile still apply on top of it.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def post_worker_init(worker):
+    """
+    Open the database connection as soon as the worker has loaded the app,
+    so the first request it serves doesn't pay for connecting. With
+    CONN_MAX_AGE set the connection is then reused by the requests.
+    """
+    from django.db import connections
+
+    try:
+        with connections['default'].cursor() as cursor:
+            cursor.execute('SELECT 1')
+    except Exception as e:
+        # Not fatal: the first request will connect (or fail) as usual
+        logger.warning("Database warmup failed in worker %s: %s", worker.pid, e)
@@ -17,7 +17,7 @@ env = environ.Env(
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 # Take environment variables from .env file
-environ.Env.read_env(os.path.join(BASE_DIR, '.env'))
+environ.Env.read_env(str(BASE_DIR / '.env'))
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = env('SECRET_KEY')
@@ -28,6 +28,9 @@ DEBUG = env('DEBUG')
 # Set site URL based on environment or use default based on DEBUG
 SITE_URL = env('SITE_URL')
 
+# API-only deployments leave out the admin site and the messages framework it needs
+API_ONLY = env.bool('API_ONLY', default=False)
+
 ALLOWED_HOSTS = env('ALLOWED_HOSTS')
 
 # Application definition
@@ -54,6 +57,12 @@ INSTALLED_APPS = [
     'apps.api',
 ]
 
+if API_ONLY:
+    INSTALLED_APPS = [
+        app for app in INSTALLED_APPS
+        if app not in ('django.contrib.admin', 'django.contrib.messages')
+    ]
+
 SITE_ID = 1 # Required by allauth
 
 MIDDLEWARE = [
@@ -62,12 +71,16 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
+    'apps.api.middleware.EnsureCSRFCookieMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'allauth.account.middleware.AccountMiddleware', # Add allauth middleware
 ]
 
+if API_ONLY:
+    MIDDLEWARE.remove('django.contrib.messages.middleware.MessageMiddleware')
+
 ROOT_URLCONF = 'project.urls'
 
 TEMPLATES = [
@@ -86,6 +99,11 @@ TEMPLATES = [
     },
 ]
 
+if API_ONLY:
+    TEMPLATES[0]['OPTIONS']['context_processors'].remove(
+        'django.contrib.messages.context_processors.messages'
+    )
+
 WSGI_APPLICATION = 'project.wsgi.application'
 
 # Database
@@ -93,7 +111,13 @@ WSGI_APPLICATION = 'project.wsgi.application'
 
 # Use DATABASE_URL environment variable for database configuration
 DATABASES = {
-    'default': env.db('DATABASE_URL', default='sqlite:///db.sqlite3')
+    'default': {
+        **env.db('DATABASE_URL', default='sqlite:///db.sqlite3'),
+        # Keep connections open between requests instead of reconnecting every time;
+        # health checks replace connections that went away while idle
+        'CONN_MAX_AGE': env.int('CONN_MAX_AGE', default=60),
+        'CONN_HEALTH_CHECKS': True,
+    }
 }
 
 # Password validation
@@ -138,7 +162,7 @@ STATIC_URL_PRODUCTION_DEFAULT = '/api/static/'
 # Set STATIC_URL based on DEBUG status, allowing override via environment variable
 STATIC_URL = env('STATIC_URL', default=STATIC_URL_PRODUCTION_DEFAULT if not DEBUG else STATIC_URL_DEFAULT)
 
-STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+STATIC_ROOT = str(BASE_DIR / 'staticfiles')
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
@@ -193,6 +217,10 @@ REST_FRAMEWORK = {
         # BasicAuthentication removed as SessionAuthentication is primary
         # 'rest_framework.authentication.BasicAuthentication',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
 # Authentication settings
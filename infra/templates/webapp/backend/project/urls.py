@@ -4,38 +4,11 @@ URL configuration for project.
 The `urlpatterns` list routes URLs to views. For more information please see:
     https://docs.djangoproject.com/en/4.2/topics/http/urls/
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include, re_path
-from django.http import JsonResponse
-from django.db import connection
-from django.db.utils import OperationalError
-
-# Health-check endpoint with database check
-def health_check(request):
-    # Check database availability
-    db_status = "ok"
-    try:
-        # Try to execute a simple SQL query
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-    except OperationalError:
-        db_status = "error"
-
-    status = "ok" if db_status == "ok" else "error"
-
-    # Return both service and database status
-    return JsonResponse({
-        "status": status,
-        "components": {
-            "database": db_status,
-            "app": "ok"
-        }
-    }, status=200 if status == "ok" else 500)
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
-
     # API URLs
     path('api/v1/', include('apps.api.urls')),
 
@@ -44,6 +17,9 @@ urlpatterns = [
     path('api/v1/auth/registration/', include('dj_rest_auth.registration.urls')),
     path('accounts/', include('allauth.urls')),
 
-    # Health check endpoint
-    path('api/v1/health/', health_check, name='health_check'),
+    # Health check endpoint: api/v1/health/ is served by apps.api (HealthCheckView)
 ]
+
+# The admin site is left out of API-only deployments (see API_ONLY in settings)
+if not settings.API_ONLY:
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
@@ -5,14 +5,14 @@ Template-specific environment setup script for the 'webapp' template.
 import logging
 import os  # Add os import for path joining
 from pathlib import Path # Import Path
-import copy # Import copy
 import secrets
-import string
+from concurrent.futures import ThreadPoolExecutor
 from infra.project_setup.environment import (
     setup_python_environment,
     setup_database,
     setup_frontend_environment,
-    setup_bucket
+    setup_buckets,
+    synchronized_log_func
 )
 from infra.project_setup.types import ProjectSetupContext
 import subprocess
@@ -36,6 +36,14 @@ def setup(ctx: 'ProjectSetupContext') -> str:
     """
     logger.info(f"Running webapp template environment setup for project: {ctx.name}")
 
+    # 0. Create the Django static files bucket and the frontend bucket concurrently
+    bucket_results = setup_buckets(ctx, {
+        f"{ctx.name}-static": True,
+        ctx.name: True,
+    })
+    for bucket_name, result in bucket_results.items():
+        logger.info(f"Bucket creation attempt for {bucket_name}: {'successful' if result else 'failed or bucket already exists'}.")
+
     # 1. Setup Backend
     final_db_name = _setup_backend(ctx)
 
@@ -55,28 +63,26 @@ def _setup_backend(ctx: 'ProjectSetupContext') -> str:
 
     # Set Yandex Cloud infrastructure names based on project name
     project_name = ctx.name
-    ctx.github_secrets['YC_API_GATEWAY_NAME'] = f"{project_name}-api-gateway"
-    ctx.github_secrets['YC_STATIC_BUCKET_NAME'] = f"{project_name}-static"
-    ctx.github_secrets['YC_CONTAINER_NAME'] = f"{project_name}-backend"
-    ctx.github_secrets['ALLOWED_HOSTS'] = f"{project_name}.website.yandexcloud.net"
-    ctx.github_secrets['CORS_ALLOWED_ORIGINS'] = f"https://{project_name}.website.yandexcloud.net"
-    ctx.github_secrets['SITE_URL'] = f"https://{project_name}.website.yandexcloud.net"
-
+    ctx.github_secrets.update({
+        'YC_API_GATEWAY_NAME': f"{project_name}-api-gateway",
+        'YC_STATIC_BUCKET_NAME': f"{project_name}-static",
+        'YC_CONTAINER_NAME': f"{project_name}-backend",
+        'ALLOWED_HOSTS': f"{project_name}.website.yandexcloud.net",
+        'CORS_ALLOWED_ORIGINS': f"https://{project_name}.website.yandexcloud.net",
+        'SITE_URL': f"https://{project_name}.website.yandexcloud.net",
+    })
 
-    # Create Yandex Cloud bucket for Django static files using environment module
-    bucket_name = f"{project_name}-static"
-    result = setup_bucket(ctx, bucket_name, public_read=True)
-    logger.info(f"Bucket creation attempt for {bucket_name}: {'successful' if result else 'failed or bucket already exists'}.")
 
 
     # Add local development variables to project_env
     local_env = ProjectEnv(Path(ctx.project_dir) / 'backend' / '.env')
-    local_env.set_var('CORS_ALLOWED_ORIGINS', "http://localhost:3000")
-    local_env.set_var('SITE_URL', "http://localhost:8000")
+    local_env.set_vars({
+        'CORS_ALLOWED_ORIGINS': "http://localhost:3000",
+        'SITE_URL': "http://localhost:8000",
+    })
 
-    # Generate Django Secret Key - using only safe characters
-    safe_chars = string.ascii_letters + string.digits + '-_!@#$%^&*()[]{}|;:,.<>?'
-    django_key = ''.join(secrets.choice(safe_chars) for i in range(50))
+    # Generate Django Secret Key - URL-safe characters only, ~50 chars from one urandom read
+    django_key = secrets.token_urlsafe(38)
     ctx.github_secrets['DJANGO_SECRET_KEY'] = django_key
 
     logger.info(f"Set YC infrastructure secrets and generated Django key for project: {project_name}")
@@ -86,24 +92,29 @@ def _setup_backend(ctx: 'ProjectSetupContext') -> str:
     logger.info(f"Backend directory is {backend_dir}.")
 
     # Create a context specific to the backend setup
-    backend_ctx = copy.deepcopy(ctx)
-    backend_ctx.project_dir = backend_dir # Update project_dir
+    backend_ctx = ctx.with_project_dir(backend_dir)
     backend_ctx.project_env = local_env.read()
+    # Both steps below log through the backend context from their own threads
+    backend_ctx.log_func = synchronized_log_func(ctx.log_func)
     logger.debug(f"Created backend-specific context with project_dir: {backend_ctx.project_dir}")
 
-    # 1. Set up Backend Python virtual environment using the backend context
-    logger.info("Setting up Python environment for backend.")
-    setup_python_environment(backend_ctx)
+    # The virtual environment and the database are independent, so set them up concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # 1. Set up Backend Python virtual environment using the backend context
+        logger.info("Setting up Python environment for backend.")
+        venv_future = executor.submit(setup_python_environment, backend_ctx)
 
-    # 2. Create database if needed, using the backend context
-    logger.debug("Checking if database creation is needed (using backend context)")
-    setup_database(backend_ctx)
+        # 2. Create database if needed, using the backend context
+        logger.debug("Checking if database creation is needed (using backend context)")
+        database_future = executor.submit(setup_database, backend_ctx)
+
+        venv_future.result()
+        database_future.result()
 
     if 'DATABASE_URL' in backend_ctx.github_secrets:
         ctx.github_secrets['DATABASE_URL'] = backend_ctx.github_secrets['DATABASE_URL']
 
-    for k, v in backend_ctx.project_env.items():
-        local_env.set_var(k, v)
+    local_env.set_vars(backend_ctx.project_env)
 
     logger.debug("Backend setup finished.")
 
@@ -112,19 +123,15 @@ def _setup_frontend(ctx: 'ProjectSetupContext'):
     """Performs setup steps for the frontend environment."""
     logger.debug("Starting frontend setup.")
     project_name = ctx.name
-    ctx.github_secrets['YC_FRONTEND_CONTAINER_NAME'] = f"{project_name}-frontend"
-    ctx.github_secrets['YC_BUCKET_NAME'] = project_name
-    ctx.github_secrets['DOMAIN_NAME'] = f"{project_name}.website.yandexcloud.net"
-
-    # Create Yandex Cloud bucket for static files using environment module
-    bucket_name = f"{project_name}"
-    result = setup_bucket(ctx, bucket_name, public_read=True)
-    logger.info(f"Bucket creation attempt for {bucket_name}: {'successful' if result else 'failed or bucket already exists'}.")
+    ctx.github_secrets.update({
+        'YC_FRONTEND_CONTAINER_NAME': f"{project_name}-frontend",
+        'YC_BUCKET_NAME': project_name,
+        'DOMAIN_NAME': f"{project_name}.website.yandexcloud.net",
+    })
 
 
-    # Generate app secret - using only safe characters
-    safe_chars = string.ascii_letters + string.digits + '-_!@#$%^&*()[]{}|;:,.<>?'
-    app_secret = ''.join(secrets.choice(safe_chars) for i in range(50))
+    # Generate app secret - URL-safe characters only, ~50 chars from one urandom read
+    app_secret = secrets.token_urlsafe(38)
     ctx.github_secrets['APP_SECRET'] = app_secret
 
     # Determine frontend directory relative to the original project root
@@ -132,8 +139,7 @@ def _setup_frontend(ctx: 'ProjectSetupContext'):
     logger.info(f"Frontend directory is {frontend_dir}.")
 
     # Create a context specific to the frontend setup
-    frontend_ctx = copy.deepcopy(ctx)
-    frontend_ctx.project_dir = frontend_dir # Update project_dir
+    frontend_ctx = ctx.with_project_dir(frontend_dir)
     logger.debug(f"Created frontend-specific context with project_dir: {frontend_ctx.project_dir}")
 
     # Call the centralized function with the frontend context
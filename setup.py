@@ -2,6 +2,8 @@
 Setup script for creating a macOS application bundle using py2app.
 """
 
+import sys
+
 from setuptools import setup
 
 APP = ['infra/gui/app.py']
@@ -26,10 +28,14 @@ OPTIONS = {
     }
 }
 
+# Only fetch py2app when actually building the app bundle; build_macos_app.sh
+# installs it beforehand anyway, and other commands don't need it
+SETUP_REQUIRES = ['py2app'] if 'py2app' in sys.argv[1:] else []
+
 setup(
     name="Infra",
     app=APP,
     data_files=DATA_FILES,
     options={'py2app': OPTIONS},
-    setup_requires=['py2app'],
+    setup_requires=SETUP_REQUIRES,
 ) 
\ No newline at end of file